@@ -22,6 +22,7 @@ from meowlauncher.games.mame_common.machine import (
 	iter_machines_from_source_file,
 )
 from meowlauncher.games.mame_common.mame import MAME
+from meowlauncher.games.mame_common.mame_helpers import build_default_image_indexes
 from meowlauncher.settings.platform_config import platform_configs
 from meowlauncher.util.desktop_files import has_been_done
 
@@ -92,6 +93,7 @@ class Arcade(GameSource):
 		return game
 
 	def iter_games(self) -> Iterator['ArcadeGame']:
+		build_default_image_indexes()
 		if self.config.drivers:
 			for driver_name in self.config.drivers:
 				game = self._process_machine(get_machine(driver_name, self.emu))
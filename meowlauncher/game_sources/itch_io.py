@@ -5,7 +5,7 @@ from pathlib import Path
 
 from meowlauncher.config import current_config, main_config
 from meowlauncher.game_sources.settings import ItchioConfig
-from meowlauncher.games.itch import ItchGame
+from meowlauncher.games.itch import ItchGame, find_launch_candidates
 from meowlauncher.util.desktop_files import has_been_done
 
 logger = logging.getLogger(__name__)
@@ -20,6 +20,7 @@ def scan_itch_dir(path: Path) -> ItchGame | None:
 
 
 def do_itch_io_games() -> None:
+	games: list[ItchGame] = []
 	for itch_io_folder in itch_io_config.itch_io_folders:
 		if not itch_io_folder.is_dir():
 			logger.warning('%s does not exist/is not a directory', itch_io_folder)
@@ -43,4 +44,9 @@ def do_itch_io_games() -> None:
 			# Well I guess technically they would be, by launching the file with xdg-open, but we don't want to do it that way and also haven't set that up
 
 			game.add_info()
-			game.make_launcher()
+			games.append(game)
+
+	# Find what to launch for all the games at once, as that needs to run butler for each of them
+	find_launch_candidates(games)
+	for game in games:
+		game.make_launcher()
@@ -1,13 +1,19 @@
 import configparser
+import hashlib
 import json
 import os
 import re
 import zipfile
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
+from meowlauncher.config import main_config
+from meowlauncher.util.persistent_cache import PersistentLRUCache
 from meowlauncher.util.utils import NoNonsenseConfigParser
+from meowlauncher.version import __version__
 
 from .engine_info import (
 	add_gamemaker_metadata,
@@ -27,10 +33,39 @@ if TYPE_CHECKING:
 	from meowlauncher.info import GameInfo
 
 
+class _FolderContents:
+	"""What is directly inside a folder, listed once, so each engine check can look at that instead of listing the folder or statting things in it all over again"""
+
+	def __init__(self, path: Path) -> None:
+		self.path = path
+		self.files: list[Path] = []
+		"""In the order the filesystem gave them to us, as some checks just use the first thing that matches"""
+		self.dirs: list[Path] = []
+		with os.scandir(path) as it:
+			for entry in it:
+				try:
+					if entry.is_dir():
+						self.dirs.append(Path(entry.path))
+					elif entry.is_file():
+						self.files.append(Path(entry.path))
+				except OSError:
+					continue
+		self.file_names = {f.name for f in self.files}
+		self.dir_names = {d.name for d in self.dirs}
+		self.lowercase_file_names = {name.lower() for name in self.file_names}
+
+	def has_file(self, name: str) -> bool:
+		return name in self.file_names
+
+	def has_dir(self, name: str) -> bool:
+		return name in self.dir_names
+
+
 def _try_detect_unity(
-	folder: Path, game_info: 'GameInfo | None', executable: 'Path | None'
+	contents: _FolderContents, game_info: 'GameInfo | None', executable: 'Path | None'
 ) -> str | None:
-	if folder.joinpath('Build', 'UnityLoader.js').is_file():
+	folder = contents.path
+	if contents.has_dir('Build') and folder.joinpath('Build', 'UnityLoader.js').is_file():
 		# Web version of Unity, there should be some .unityweb files here
 		if game_info:
 			add_unity_web_metadata(folder, game_info)
@@ -39,13 +74,10 @@ def _try_detect_unity(
 	unity_data_folder = None
 	if executable and executable.suffix != '.sh':
 		unity_data_folder_name = executable.stem.removesuffix('_Debug') + '_Data'
-		if folder.joinpath(unity_data_folder_name).is_file():
+		if contents.has_dir(unity_data_folder_name):
 			unity_data_folder = folder / unity_data_folder_name
 	else:
-		for f in folder.iterdir():
-			if not f.is_dir():
-				continue
-
+		for f in contents.dirs:
 			if f.name.endswith('_Data'):
 				# This folder "blah_Data" seems to always go with an executable named "blah", "blah.exe" (on Windows), "blah.x86", "blah.x86_64"
 				# boot.config may be interesting? I dunno there's a vr-enabled in there
@@ -59,18 +91,16 @@ def _try_detect_unity(
 		if game_info:
 			add_unity_metadata(unity_data_folder, game_info)
 
-		try:
+		if contents.has_file('UnityPlayer.dll'):
 			props = get_exe_properties(folder / 'UnityPlayer.dll')[0]
 			if props:
 				unity_version = props.get('UnityVersion', props.get('Unity Version'))
 				if unity_version:
 					return f'Unity ({unity_version})'
-		except FileNotFoundError:
-			pass
 		if executable and executable.suffix.lower() == '.exe':
 			exe_path = executable
 		else:
-			exe_path = folder.joinpath(unity_data_folder.name.removesuffix('_Name') + '.exe')
+			exe_path = folder.joinpath(unity_data_folder.name.removesuffix('_Data') + '.exe')
 		if exe_path.is_file():
 			props = get_exe_properties(exe_path)[0]
 			if props:
@@ -107,15 +137,15 @@ def _try_detect_unity(
 	return None
 
 
-def _try_detect_ue4(folder: Path, game_info: 'GameInfo | None') -> bool:
-	if folder.joinpath(folder.name + '.uproject').is_file():
+def _try_detect_ue4(contents: _FolderContents, game_info: 'GameInfo | None') -> bool:
+	folder = contents.path
+	if contents.has_file(folder.name + '.uproject'):
 		return True
 
-	engine_folder = folder.joinpath(
-		'Engine'
-	)  # I guess this is always there… dunno if anything is _always_ in there though (Binaries + Content?)
-	if not engine_folder.is_dir():
+	# I guess this is always there… dunno if anything is _always_ in there though (Binaries + Content?)
+	if not contents.has_dir('Engine'):
 		return False
+	engine_folder = folder.joinpath('Engine')
 
 	if engine_folder.joinpath('Binaries', 'Linux', 'UE4Game-Linux-Shipping').is_file():
 		return True
@@ -139,11 +169,9 @@ def _try_detect_ue4(folder: Path, game_info: 'GameInfo | None') -> bool:
 	# Something like Blah/Binaries/Linux/Blah-Linux-Shipping
 	project_name: str
 	binaries_folder = None
-	for subdir in folder.iterdir():
+	for subdir in contents.dirs:
 		if subdir.name == 'Engine':
 			continue
-		if not subdir.is_dir():
-			continue
 		maybe_binaries_path = subdir.joinpath('Binaries')
 		if maybe_binaries_path.is_dir():
 			project_name = subdir.name
@@ -169,18 +197,18 @@ def _try_detect_ue4(folder: Path, game_info: 'GameInfo | None') -> bool:
 	return False
 
 
-def _try_detect_build(folder: Path) -> bool:
-	files = {f.name.lower() for f in folder.iterdir() if f.is_file()}
+def _try_detect_build(contents: _FolderContents) -> bool:
+	files = contents.lowercase_file_names
 	if 'build.exe' in files and 'bsetup.exe' in files and 'editart.exe' in files:
 		return True
-	for f in folder.iterdir():
-		if f.name.lower() == 'build' and f.is_dir() and _try_detect_build(f):
+	for f in contents.dirs:
+		if f.name.lower() == 'build' and _try_detect_build(_FolderContents(f)):
 			return True
 	return False
 
 
-def _try_detect_ue3(folder: Path) -> bool:
-	for f in folder.iterdir():
+def _try_detect_ue3(contents: _FolderContents) -> bool:
+	for f in contents.dirs:
 		if f.name in {'Game', 'GAME'}:
 			continue
 		if (
@@ -189,31 +217,33 @@ def _try_detect_ue3(folder: Path) -> bool:
 			or (f.name.isupper() and f.name.endswith('GAME'))
 		):
 			# What the heck is P13 about? Oh well
-			if f.is_dir():
-				if f.joinpath('CookedPC', 'Engine.u').is_file():
-					return True
-				if (
-					f.joinpath('CookedPCConsole').is_dir()
-					or f.joinpath('CookedPCConsole_FR').is_dir()
-					or f.joinpath('CookedPCConsoleFinal').is_dir()
-				):
-					return True
-				if f.joinpath('CookedWiiU', 'Engine.xxx').is_file():
-					return True
-				if f.joinpath(
-					'COOKEDPS3', 'ENGINE.XXX'
-				).is_file():  # PS3 filesystems are in yelling case
-					return True
+			if f.joinpath('CookedPC', 'Engine.u').is_file():
+				return True
+			if (
+				f.joinpath('CookedPCConsole').is_dir()
+				or f.joinpath('CookedPCConsole_FR').is_dir()
+				or f.joinpath('CookedPCConsoleFinal').is_dir()
+			):
+				return True
+			if f.joinpath('CookedWiiU', 'Engine.xxx').is_file():
+				return True
+			if f.joinpath(
+				'COOKEDPS3', 'ENGINE.XXX'
+			).is_file():  # PS3 filesystems are in yelling case
+				return True
 	return False
 
 
-def _try_detect_gamemaker(folder: Path, game_info: 'GameInfo | None') -> bool:
+def _try_detect_gamemaker(contents: _FolderContents, game_info: 'GameInfo | None') -> bool:
+	folder = contents.path
 	possible_data_file_paths = [
-		folder / 'data.win',
-		folder / 'game.unx',
-		folder.joinpath('assets', 'data.win'),
-		folder.joinpath('assets', 'game.unx'),
+		folder / name for name in ('data.win', 'game.unx') if contents.has_file(name)
 	]
+	if contents.has_dir('assets'):
+		possible_data_file_paths += [
+			folder.joinpath('assets', 'data.win'),
+			folder.joinpath('assets', 'game.unx'),
+		]
 	for data_file_path in possible_data_file_paths:
 		try:
 			with data_file_path.open('rb') as f:
@@ -227,17 +257,14 @@ def _try_detect_gamemaker(folder: Path, game_info: 'GameInfo | None') -> bool:
 	return False
 
 
-def _try_detect_source(folder: Path) -> bool:
-	have_bin = folder.joinpath('bin').is_dir()
-	have_platform = folder.joinpath('platform').is_dir()
+def _try_detect_source(contents: _FolderContents) -> bool:
+	have_bin = contents.has_dir('bin')
+	have_platform = contents.has_dir('platform')
 	if not (have_bin or have_platform):
 		return False
 
 	game_folder = None
-	for subdir in folder.iterdir():
-		if not subdir.is_dir():
-			continue
-
+	for subdir in contents.dirs:
 		# Checking for 'hl2', 'ep1', etc
 		if subdir.joinpath('gameinfo.txt').is_file():
 			game_folder = subdir
@@ -251,25 +278,27 @@ def _try_detect_source(folder: Path) -> bool:
 	return False
 
 
-def _try_detect_adobe_air(folder: Path, game_info: 'GameInfo | None') -> bool:
+def _try_detect_adobe_air(contents: _FolderContents, game_info: 'GameInfo | None') -> bool:
+	folder = contents.path
 	metainf_dir = folder.joinpath('META-INF', 'AIR')
-	if metainf_dir.is_dir():
+	if contents.has_dir('META-INF') and metainf_dir.is_dir():
 		application_xml = metainf_dir.joinpath('application.xml')
 		if application_xml.is_file() and metainf_dir.joinpath('hash').is_file():
 			if game_info:
 				add_metadata_for_adobe_air(folder, application_xml, game_info)
 			return True
 
-	share = folder / 'share'
-	if share.is_dir() and _try_detect_adobe_air(folder / 'share', game_info):
+	if contents.has_dir('share') and _try_detect_adobe_air(
+		_FolderContents(folder / 'share'), game_info
+	):
 		return True
 
-	if folder.joinpath('Adobe AIR').is_dir():
+	if contents.has_dir('Adobe AIR'):
 		return True
-	if folder.joinpath('runtimes', 'Adobe AIR').is_dir():
+	if contents.has_dir('runtimes') and folder.joinpath('runtimes', 'Adobe AIR').is_dir():
 		return True
 
-	if folder.joinpath('AIR', 'arh').is_file():
+	if contents.has_dir('AIR') and folder.joinpath('AIR', 'arh').is_file():
 		# "Adobe Redistribution Helper" but I dunno how reliable this detection is, to be honest, but it seems to be used sometimes; games like this seem to instead check for a system-wide AIR installation and try and install that if it's not there
 		return True
 
@@ -278,22 +307,23 @@ def _try_detect_adobe_air(folder: Path, game_info: 'GameInfo | None') -> bool:
 	return False
 
 
-def _try_detect_nw(folder: Path, game_info: 'GameInfo | None') -> str | None:
+def _try_detect_nw(contents: _FolderContents, game_info: 'GameInfo | None') -> str | None:
+	folder = contents.path
 	if (
-		not folder.joinpath('nw.pak').is_file()
-		and not folder.joinpath('nw_100_percent.pak').is_file()
-		and not folder.joinpath('nw_200_percent.pak').is_file()
+		not contents.has_file('nw.pak')
+		and not contents.has_file('nw_100_percent.pak')
+		and not contents.has_file('nw_200_percent.pak')
 	):
 		return None
 
 	have_package = False
 	package_json_path = folder.joinpath('package.json')
 	package_nw_path = folder.joinpath('package.nw')
-	if package_json_path.is_file():
+	if contents.has_file('package.json'):
 		have_package = True
 		if game_info:
 			add_info_from_package_json_file(folder, package_json_path, game_info)
-	elif package_nw_path.is_file():
+	elif contents.has_file('package.nw'):
 		subengine = None
 		try:
 			with zipfile.ZipFile(package_nw_path) as package_nw:
@@ -343,10 +373,11 @@ def _try_detect_nw(folder: Path, game_info: 'GameInfo | None') -> str | None:
 
 
 def _try_detect_rpg_maker_200x(
-	folder: Path, game_info: 'GameInfo | None', executable: Path | None
+	contents: _FolderContents, game_info: 'GameInfo | None', executable: Path | None
 ) -> str | None:
+	folder = contents.path
 	rpg_rt_ini_path = folder / 'RPG_RT.ini'  # This should always be here I think?
-	if rpg_rt_ini_path.is_file():
+	if contents.has_file('RPG_RT.ini'):
 		if game_info:
 			try:
 				rpg_rt_ini = NoNonsenseConfigParser()
@@ -380,7 +411,7 @@ def _try_detect_rpg_maker_200x(
 				if product_name in product_names:
 					return 'RPG Maker ' + product_names[product_name]
 
-		for file in folder.iterdir():
+		for file in contents.files:
 			if file.suffix.lower() == '.r3proj':
 				return 'RPG Maker 2003'
 			if not executable and file.suffix.lower() == '.exe':
@@ -407,9 +438,10 @@ def _try_detect_rpg_maker_200x(
 version_tuple_definition = re.compile(r'^version_tuple\s*=\s*\((.+?)\)$')
 
 
-def _try_detect_renpy(folder: Path, game_info: 'GameInfo | None') -> str | None:
+def _try_detect_renpy(contents: _FolderContents, game_info: 'GameInfo | None') -> str | None:
+	folder = contents.path
 	renpy_folder = folder / 'renpy'
-	if renpy_folder.is_dir():
+	if contents.has_dir('renpy'):
 		if game_info:
 			game_folder = folder / 'game'
 			options = game_folder / 'options.rpy'
@@ -441,9 +473,9 @@ def _try_detect_renpy(folder: Path, game_info: 'GameInfo | None') -> str | None:
 	return None
 
 
-def _try_detect_godot(folder: Path) -> bool:
-	for f in folder.iterdir():
-		if f.is_file() and f.suffix.lower() == '.pck':
+def _try_detect_godot(contents: _FolderContents) -> bool:
+	for f in contents.files:
+		if f.suffix.lower() == '.pck':
 			with f.open('rb') as pck:
 				if pck.read(4) == b'GDPC':
 					return True
@@ -463,8 +495,9 @@ def _try_detect_rpg_paper_maker(folder: Path) -> bool:
 
 
 def _try_detect_rpg_maker_xp_vx(
-	folder: Path, game_info: 'GameInfo | None', executable: Path | None
+	contents: _FolderContents, game_info: 'GameInfo | None', executable: Path | None
 ) -> str | None:
+	folder = contents.path
 	engine_versions = {
 		'rgss1': 'RPG Maker XP',
 		'rgss2': 'RPG Maker VX',
@@ -476,14 +509,11 @@ def _try_detect_rpg_maker_xp_vx(
 	if executable:
 		if executable.suffix.lower() != '.exe':
 			game_stem = executable.stem
-		elif not mkxp_path.is_file():
+		elif not contents.has_file('mkxp.conf'):
 			# This is otherwise a Windows engine, so if the executable is not that, not really possible without a compatibility thing like that
 			return None
 	else:
-		for f in folder.iterdir():
-			if not f.is_file():
-				continue
-
+		for f in contents.files:
 			ext = f.suffix.lower()[1:]
 			if ext == 'rgssad':
 				game_stem = f.stem
@@ -502,14 +532,14 @@ def _try_detect_rpg_maker_xp_vx(
 				# The full filename is something like RGSS301.dll for specific builds of each engine
 				engine = engine_versions[f.stem[:5].lower()]
 				break
-	if mkxp_path.is_file() and not engine:
+	if contents.has_file('mkxp.conf') and not engine:
 		engine = 'RPG Maker XP/VX/Ace'
 
 	if engine:
 		if not game_stem:
 			game_stem = 'Game'  # Make an assumption; mkxp seems to default to this at least
 		game_ini_path = folder / f'{game_stem}.ini'
-		if game_ini_path.is_file():  # Should be?
+		if contents.has_file(game_ini_path.name):  # Should be?
 			game_ini = NoNonsenseConfigParser()
 			try:
 				game_ini.read(game_ini_path)
@@ -534,7 +564,7 @@ def _try_detect_rpg_maker_xp_vx(
 			except (KeyError, UnicodeDecodeError, configparser.ParsingError):
 				pass
 			# Sometimes there is a Fullscreen++ section, not sure what it could tell me, whether the game starts in fullscreen or supports it differently or what
-		if mkxp_path.is_file():
+		if contents.has_file('mkxp.conf'):
 			engine += ' (mkxp)'
 			if game_info:
 				for line in mkxp_path.read_text().splitlines():
@@ -549,12 +579,13 @@ def _try_detect_rpg_maker_xp_vx(
 	return None
 
 
-def _try_detect_cryengine(folder: Path) -> str | None:
+def _try_detect_cryengine(contents: _FolderContents) -> str | None:
+	folder = contents.path
 	cryengine32_path = folder.joinpath('Bin32', 'CrySystem.dll')
 	cryengine64_path = folder.joinpath('Bin64', 'CrySystem.dll')
-	if cryengine64_path.is_file():
+	if contents.has_dir('Bin64') and cryengine64_path.is_file():
 		cryengine_dll = cryengine64_path
-	elif cryengine32_path.is_file():
+	elif contents.has_dir('Bin32') and cryengine32_path.is_file():
 		cryengine_dll = cryengine32_path
 	else:
 		return None
@@ -567,9 +598,9 @@ def _try_detect_cryengine(folder: Path) -> str | None:
 	return engine_version
 
 
-def _try_detect_jackbox_games(folder: Path, game_info: 'GameInfo | None') -> bool:
-	jbg_config_jet_path = folder / 'jbg.config.jet'
-	if folder.joinpath('platform.swf').is_file() and jbg_config_jet_path.is_file():
+def _try_detect_jackbox_games(contents: _FolderContents, game_info: 'GameInfo | None') -> bool:
+	jbg_config_jet_path = contents.path / 'jbg.config.jet'
+	if contents.has_file('platform.swf') and contents.has_file('jbg.config.jet'):
 		if game_info:
 			jbg_config_jet = json.loads(jbg_config_jet_path.read_text())
 			game_name = jbg_config_jet.get('gameName')
@@ -603,8 +634,11 @@ def _try_detect_jackbox_games(folder: Path, game_info: 'GameInfo | None') -> boo
 	return False
 
 
-def _try_detect_piko_mednafen(folder: Path, game_info: 'GameInfo | None') -> str | None:
+def _try_detect_piko_mednafen(contents: _FolderContents, game_info: 'GameInfo | None') -> str | None:
 	"""Piko's fork of Mednafen for emulated rereleases, probably has an actual name, but I don't know/care (also it is not really an engine)"""
+	if not contents.has_dir('res'):
+		return None
+	folder = contents.path
 	data_path = folder / 'res' / 'data'
 	game_path = folder / 'res' / 'game'
 	game_cue_path = folder / 'res' / 'game.cue'
@@ -664,9 +698,9 @@ def _try_detect_piko_mednafen(folder: Path, game_info: 'GameInfo | None') -> str
 	return None
 
 
-def _try_detect_engines_from_filenames(folder: Path) -> str | None:
-	dir_entries = set(folder.iterdir())
-	files = {f.name.lower() for f in dir_entries if f.is_file()}
+def _try_detect_engines_from_filenames(contents: _FolderContents) -> str | None:
+	folder = contents.path
+	files = contents.lowercase_file_names
 
 	# These are simple enough to detect with just one line…
 	if 'acsetup.cfg' in files:
@@ -679,7 +713,7 @@ def _try_detect_engines_from_filenames(folder: Path) -> str | None:
 		return 'Defold'
 	if 'fna.dll' in files:
 		return 'FNA'
-	if 'data.xp3' in files and any(f.suffix.lower() == '.cf' for f in folder.iterdir()):
+	if 'data.xp3' in files and any(f.endswith('.cf') for f in files):
 		# TODO: Check exe to see if it is KiriKiri Z (ProductName = "TVP(KIRIKIRI) Z core / Scripting Platform for Win32")
 		return 'KiriKiri'
 	if 'monogame.framework.dll' in files or 'monogame.framework.lite.dll' in files:
@@ -700,26 +734,28 @@ def _try_detect_engines_from_filenames(folder: Path) -> str | None:
 		# Is GuruguruSMF4.dll always there? Doesn't seem to be part of the thing
 		return 'Wolf RPG Editor'
 
-	if folder.joinpath('Pack', 'data').is_dir() and any(
+	if contents.has_dir('Pack') and folder.joinpath('Pack', 'data').is_dir() and any(
 		f.suffix.lower() == '.ttarch' for f in folder.joinpath('Pack', 'data').iterdir()
 	):
 		return 'Telltale Tool'
-	if (
+	if contents.has_dir('bin') and (
 		folder.joinpath('bin', 'libUnigine_x64.so').is_file()
 		or folder.joinpath('bin', 'libUnigine_x86.so').is_file()
 		or folder.joinpath('bin', 'Unigine_x86.dll').is_file()
 		or folder.joinpath('bin', 'Unigine_x64.dll').is_file()
 	):
 		return 'Unigine'
-	if folder.joinpath('System', 'Engine.u').is_file():
+	if contents.has_dir('System') and folder.joinpath('System', 'Engine.u').is_file():
 		# Also check Editor.u or Core.u if this gets false positives somehow
 		return 'Unreal Engine 1'
-	if folder.joinpath('Build', 'Final', 'DefUnrealEd.ini').is_file():
+	if contents.has_dir('Build') and folder.joinpath('Build', 'Final', 'DefUnrealEd.ini').is_file():
 		return 'Unreal Engine 2'  # Possibly 2.5 specifically
-	if folder.joinpath('Builds', 'Binaries', 'DefUnrealEd.ini').is_file():
+	if contents.has_dir('Builds') and folder.joinpath('Builds', 'Binaries', 'DefUnrealEd.ini').is_file():
 		return 'Unreal Engine 2'  # Possibly 2.5 specifically
 
-	if 'alldata.psb.m' in files or folder.joinpath('windata', 'alldata.psb.m').is_file():
+	if 'alldata.psb.m' in files or (
+		contents.has_dir('windata') and folder.joinpath('windata', 'alldata.psb.m').is_file()
+	):
 		return 'M2Engage'
 
 	return None
@@ -780,58 +816,59 @@ def try_detect_engine_from_exe(exe_path: Path, game_info: 'GameInfo | None') ->
 def try_and_detect_engine_from_folder(
 	folder: Path, game_info: 'GameInfo | None' = None, executable: Path | None = None
 ) -> str | None:
+	contents = _FolderContents(folder)
 	# Get the most likely things out of the way first
-	unity_version = _try_detect_unity(folder, game_info, executable)
+	unity_version = _try_detect_unity(contents, game_info, executable)
 	if unity_version:
 		return unity_version
-	if _try_detect_ue4(folder, game_info):
+	if _try_detect_ue4(contents, game_info):
 		return 'Unreal Engine 4'
-	if _try_detect_ue3(folder):
+	if _try_detect_ue3(contents):
 		return 'Unreal Engine 3'
-	renpy_version = _try_detect_renpy(folder, game_info)
+	renpy_version = _try_detect_renpy(contents, game_info)
 	if renpy_version:
 		return renpy_version
 	nw_version = _try_detect_nw(
-		folder, game_info
+		contents, game_info
 	)  # Not really the right name for this variable, it's to check if it's just nw.js or has RPG Maker MV/MZ inside
 	if nw_version:
 		return nw_version
-	if _try_detect_gamemaker(folder, game_info):
+	if _try_detect_gamemaker(contents, game_info):
 		return 'GameMaker'
-	rpg_maker_xp_version = _try_detect_rpg_maker_xp_vx(folder, game_info, executable)
+	rpg_maker_xp_version = _try_detect_rpg_maker_xp_vx(contents, game_info, executable)
 	if rpg_maker_xp_version:
 		return rpg_maker_xp_version
 
 	# XNA: Might have a "common redistributables" folder with an installer in it?
-	engine = _try_detect_engines_from_filenames(folder)
+	engine = _try_detect_engines_from_filenames(contents)
 	if engine:
 		return engine
 
-	if _try_detect_adobe_air(folder, game_info):
+	if _try_detect_adobe_air(contents, game_info):
 		return 'Adobe AIR'
-	if _try_detect_build(folder):
+	if _try_detect_build(contents):
 		return 'Build'
-	if _try_detect_godot(folder):
+	if _try_detect_godot(contents):
 		return 'Godot'
-	if _try_detect_jackbox_games(folder, game_info):
+	if _try_detect_jackbox_games(contents, game_info):
 		return 'Jackbox Games Engine'
-	if _try_detect_source(folder):
+	if _try_detect_source(contents):
 		return 'Source'
 
-	cryengine_version = _try_detect_cryengine(folder)
+	cryengine_version = _try_detect_cryengine(contents)
 	if cryengine_version:
 		return cryengine_version
-	piko_mednafen = _try_detect_piko_mednafen(folder, game_info)
+	piko_mednafen = _try_detect_piko_mednafen(contents, game_info)
 	if piko_mednafen:
 		return piko_mednafen
-	rpg_maker_200x_version = _try_detect_rpg_maker_200x(folder, game_info, executable)
+	rpg_maker_200x_version = _try_detect_rpg_maker_200x(contents, game_info, executable)
 	if rpg_maker_200x_version:
 		return rpg_maker_200x_version
 
 	if not executable:
-		for f in folder.iterdir():
+		for f in contents.files:
 			# Last ditch effort if we still didn't detect an engine from the folder… not great, since there could be all sorts of exes, but whaddya do
-			if f.is_file() and f.suffix.lower() == '.exe':
+			if f.suffix.lower() == '.exe':
 				engine = try_detect_engine_from_exe_properties(f, game_info)
 				if engine:
 					return engine
@@ -839,16 +876,76 @@ def try_and_detect_engine_from_folder(
 	return None
 
 
-def detect_engine_recursively(folder: Path, game_info: 'GameInfo | None' = None) -> str | None:
-	# This can be slow, so maybe you should avoid using it
+_recursive_engine_detect_cache: PersistentLRUCache[
+	tuple[str, int | None, str], tuple[str | None]
+] = PersistentLRUCache('engine_detect_recursive', 10_000, __version__)
+"""{(folder, max depth, fingerprint from _walk_subfolders): (path relative to folder of the subfolder an engine was detected in, or None if nothing was found,)}
+Only the subfolder is stored and not the engine itself, so detecting it again there can still add info to the GameInfo"""
+
+
+def _walk_subfolders(folder: Path, max_depth: int | None) -> tuple[Sequence[Path], str]:
+	"""Lists subfolders of folder (not following symlinks) up to max_depth levels deep, in the same order detect_engine_recursively looks at them, along with a fingerprint of the folder names and modification times, which changes if anything is added/removed/renamed in any of them"""
+	subfolders: list[Path] = []
+	fingerprint = hashlib.sha1(usedforsecurity=False)
+
+	def walk(path: Path, depth: int) -> None:
+		with os.scandir(path) as it:
+			subdirs = [
+				(Path(entry.path), entry.stat(follow_symlinks=False).st_mtime_ns)
+				for entry in it
+				if entry.is_dir(follow_symlinks=False)
+			]
+		for subdir, mtime in subdirs:
+			subfolders.append(subdir)
+			fingerprint.update(os.fsencode(subdir.relative_to(folder)) + b'\0')
+			fingerprint.update(mtime.to_bytes(8, 'little', signed=True))
+			if max_depth is None or depth < max_depth:
+				walk(subdir, depth + 1)
+
+	fingerprint.update(folder.stat().st_mtime_ns.to_bytes(8, 'little', signed=True))
+	if max_depth != 0:
+		walk(folder, 1)
+	return subfolders, fingerprint.hexdigest()
+
+
+def _find_engine_subfolder(subfolders: Sequence[Path]) -> Path | None:
+	"""Returns the first of subfolders that an engine is detected in, checking them all at once as it is mostly waiting on the filesystem"""
+	if not subfolders:
+		return None
+	executor = ThreadPoolExecutor()
+	try:
+		# Not passing a GameInfo here, as that would have several threads adding info to it from folders that don't end up being the one we use
+		for subfolder, engine in zip(
+			subfolders, executor.map(try_and_detect_engine_from_folder, subfolders), strict=True
+		):
+			if engine:
+				return subfolder
+		return None
+	finally:
+		executor.shutdown(wait=False, cancel_futures=True)
+
+
+def detect_engine_recursively(
+	folder: Path, game_info: 'GameInfo | None' = None, max_depth: int | None = None
+) -> str | None:
+	"""Tries to detect an engine in folder, and if not, its subfolders
+	:param max_depth: How many levels of subfolders to look in, defaults to main_config.engine_detect_max_depth"""
 	engine = try_and_detect_engine_from_folder(folder, game_info)
 	if engine:
 		return engine
 
-	for subdir in folder.iterdir():
-		if subdir.is_dir() and not subdir.is_symlink():
-			engine = detect_engine_recursively(subdir, game_info)
-			if engine:
-				return engine
-
-	return None
+	if max_depth is None:
+		max_depth = main_config.engine_detect_max_depth
+	subfolders, fingerprint = _walk_subfolders(folder, max_depth)
+	cache_key = (str(folder), max_depth, fingerprint)
+	cached = _recursive_engine_detect_cache.get(cache_key)
+	if cached is not None:
+		engine_subfolder = folder / cached[0] if cached[0] is not None else None
+	else:
+		engine_subfolder = _find_engine_subfolder(subfolders)
+		_recursive_engine_detect_cache[cache_key] = (
+			str(engine_subfolder.relative_to(folder)) if engine_subfolder else None,
+		)
+	if not engine_subfolder:
+		return None
+	return try_and_detect_engine_from_folder(engine_subfolder, game_info)
@@ -61,6 +61,9 @@ def add_generic_software_info(software: 'Software', game_info: 'GameInfo') -> No
 	maxsize=5
 )  # We don't want to hold onto Machine objects forever, the maxsize is how many times we expect software with the same basename to be called in a row, which is only a handful at most (I guess it would happen if you have a bunch of games in the same directory with the same software parent?)
 def _match_arcade(software_name: str, mame: MAME) -> Machine | None:
+	# So we don't ask MAME for the XML of something that isn't there
+	if software_name not in mame.machine_basenames:
+		return None
 	try:
 		return get_machine(software_name, mame)
 	except MachineNotFoundError:
@@ -1,4 +1,5 @@
 import datetime
+import hashlib
 import io
 import logging
 import struct
@@ -20,7 +21,13 @@ try:
 except ModuleNotFoundError:
 	have_pillow = False
 
+from meowlauncher.common_paths import cache_dir
 from meowlauncher.info import Date
+from meowlauncher.util.persistent_cache import (
+	FileFingerprint,
+	PersistentLRUCache,
+	get_file_fingerprint,
+)
 from meowlauncher.util.utils import junk_suffixes
 
 if TYPE_CHECKING:
@@ -31,6 +38,17 @@ logger = logging.getLogger(__name__)
 # Hmm, are other extensions going to work as icons in a file manager
 icon_extensions = {'png', 'ico', 'xpm', 'svg'}
 
+ExeProperties = tuple['Mapping[str, str] | None', datetime.datetime | None]
+
+_exe_properties_cache: PersistentLRUCache[FileFingerprint, ExeProperties] = PersistentLRUCache(
+	'exe_properties', 50_000
+)
+_exe_icon_cache: PersistentLRUCache[FileFingerprint, tuple[str | None]] = PersistentLRUCache(
+	'exe_icons', 50_000
+)
+"""{fingerprint of exe: (filename in _exe_icon_folder of the icon extracted from it, or None if it has no icon,)}"""
+_exe_icon_folder = cache_dir / 'exe_icons'
+
 
 def _get_pe_string_table(pe: 'pefile.PE') -> 'Mapping[str, str] | None':
 	try:
@@ -49,24 +67,39 @@ def _get_pe_string_table(pe: 'pefile.PE') -> 'Mapping[str, str] | None':
 	return None
 
 
-def get_exe_properties(path: Path) -> tuple['Mapping[str, str] | None', datetime.datetime | None]:
-	if have_pefile:
+def _read_exe_properties(path: Path) -> ExeProperties:
+	try:
+		pe = pefile.PE(str(path), fast_load=True)
+		pe.parse_data_directories(pefile.DIRECTORY_ENTRY['IMAGE_DIRECTORY_ENTRY_RESOURCE'])
 		try:
-			pe = pefile.PE(str(path), fast_load=True)
-			pe.parse_data_directories(pefile.DIRECTORY_ENTRY['IMAGE_DIRECTORY_ENTRY_RESOURCE'])
-			try:
-				timestamp = datetime.datetime.fromtimestamp(pe.FILE_HEADER.TimeDateStamp)
-			except AttributeError:
-				timestamp = None
-			try:
-				return _get_pe_string_table(pe), timestamp
-			except Exception:  # pylint: disable=broad-except
-				logger.exception('Something weird happened in get_exe_properties for %s', path)
-		except pefile.PEFormatError:
-			pass
+			timestamp = datetime.datetime.fromtimestamp(pe.FILE_HEADER.TimeDateStamp)
+		except AttributeError:
+			timestamp = None
+		try:
+			return _get_pe_string_table(pe), timestamp
+		except Exception:  # pylint: disable=broad-except
+			logger.exception('Something weird happened in get_exe_properties for %s', path)
+	except pefile.PEFormatError:
+		pass
 	return None, None
 
 
+def get_exe_properties(path: Path) -> ExeProperties:
+	"""Returns the version info string table and build timestamp of a Windows executable, if it has them
+	Results are cached between runs, as the same exes get looked at every time and don't change much"""
+	if not have_pefile:
+		return None, None
+	fingerprint = get_file_fingerprint(path)
+	if fingerprint:
+		cached = _exe_properties_cache.get(fingerprint)
+		if cached is not None:
+			return cached
+	properties = _read_exe_properties(path)
+	if fingerprint:
+		_exe_properties_cache[fingerprint] = properties
+	return properties
+
+
 def add_info_for_raw_exe(path: Path, game_info: 'GameInfo') -> None:
 	props, timedatestamp = get_exe_properties(path)
 
@@ -157,7 +190,8 @@ def _parse_pe_group_icon_directory(data: bytes) -> 'Mapping[int, Mapping[str, in
 	}
 
 
-def get_icon_from_pe(pe: 'pefile.PE') -> 'Image.Image | None':
+def _get_ico_from_pe(pe: 'pefile.PE') -> bytes | None:
+	"""Returns the first group icon inside a PE as the contents of an .ico file"""
 	group_icons = _get_pe_resources(pe, pefile.RESOURCE_TYPE['RT_GROUP_ICON'])
 	if not group_icons:
 		return None
@@ -201,25 +235,86 @@ def get_icon_from_pe(pe: 'pefile.PE') -> 'Image.Image | None':
 		offset += v['bytes_in_res']
 		header += ico_entry
 		data += icon_resource_data
-	ico = header + data
+	return header + data
+
+
+def get_icon_from_pe(pe: 'pefile.PE') -> 'Image.Image | None':
+	ico = _get_ico_from_pe(pe)
+	if not ico:
+		return None
 	return Image.open(io.BytesIO(ico), formats=('ICO',))
 
 
+class _IconExtractionError(Exception):
+	"""Something went wrong getting the icon out of an exe, as opposed to it just not having one, so we shouldn't remember that it has no icon"""
+
+
+def _extract_ico_from_exe(path: Path) -> bytes | None:
+	""":raises _IconExtractionError: If it isn't a valid PE file or the icon couldn't be read"""
+	try:
+		pe = pefile.PE(str(path), fast_load=True)
+		pe.parse_data_directories(pefile.DIRECTORY_ENTRY['IMAGE_DIRECTORY_ENTRY_RESOURCE'])
+	except pefile.PEFormatError as ex:
+		raise _IconExtractionError(f'{path} is not a valid PE file') from ex
+	try:
+		ico = _get_ico_from_pe(pe)
+		if ico:
+			# Make sure it can actually be opened before we go and cache it
+			Image.open(io.BytesIO(ico), formats=('ICO',))
+	except Exception as ex:  # pylint: disable=broad-except
+		logger.exception('Something weird happened in get_icon_from_pe for %s', path)
+		raise _IconExtractionError(path) from ex
+	return ico
+
+
+def _save_exe_icon(ico: bytes) -> str | None:
+	"""Puts an extracted icon in _exe_icon_folder, named after its hash (so the same icon used in several exes is only stored once), and returns the filename, or None if it could not be saved"""
+	filename = hashlib.sha1(ico, usedforsecurity=False).hexdigest() + '.ico'
+	try:
+		_exe_icon_folder.mkdir(parents=True, exist_ok=True)
+		_exe_icon_folder.joinpath(filename).write_bytes(ico)
+	except OSError:
+		logger.exception('Could not save icon to %s', _exe_icon_folder)
+		return None
+	return filename
+
+
 def get_icon_inside_exe(path: Path) -> 'Image.Image | None':
-	if have_pefile:
-		try:
-			pe = pefile.PE(str(path), fast_load=True)
-			pe.parse_data_directories(pefile.DIRECTORY_ENTRY['IMAGE_DIRECTORY_ENTRY_RESOURCE'])
-			try:
-				icon = get_icon_from_pe(pe)
-			except Exception:  # pylint: disable=broad-except
-				logger.exception('Something weird happened in get_icon_from_pe for %s', path)
+	"""Returns the icon embedded in a Windows executable, if there is one
+	The icon (or the lack of one) is cached between runs, as parsing the resources of big exes with pefile is slow"""
+	if not have_pefile:
+		return None
+	fingerprint = get_file_fingerprint(path)
+	if fingerprint:
+		cached = _exe_icon_cache.get(fingerprint)
+		if cached is not None:
+			if cached[0] is None:
 				return None
-			if icon:
+			try:
+				icon = Image.open(
+					io.BytesIO(_exe_icon_folder.joinpath(cached[0]).read_bytes()), formats=('ICO',)
+				)
+				icon.load()
+			except (OSError, SyntaxError):
+				# Someone cleaned out the cache folder, or the icon in there is broken somehow, so just extract it again
+				pass
+			else:
 				return icon
-		except pefile.PEFormatError:
-			pass
-	return None
+
+	try:
+		ico = _extract_ico_from_exe(path)
+	except _IconExtractionError:
+		return None
+	if fingerprint:
+		if not ico:
+			_exe_icon_cache[fingerprint] = (None,)
+		else:
+			icon_filename = _save_exe_icon(ico)
+			if icon_filename:
+				_exe_icon_cache[fingerprint] = (icon_filename,)
+	if not ico:
+		return None
+	return Image.open(io.BytesIO(ico), formats=('ICO',))
 
 
 def look_for_icon_for_file(path: Path) -> 'Path | Image.Image | None':
@@ -8,8 +8,10 @@ import datetime
 import gzip
 import json
 import logging
+import os
 import subprocess
-from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -21,6 +23,7 @@ from meowlauncher.info import Date
 from meowlauncher.launch_command import LaunchCommand
 from meowlauncher.output.desktop_files import make_launcher
 from meowlauncher.util.name_utils import fix_name
+from meowlauncher.util.persistent_cache import PersistentLRUCache, get_file_fingerprint
 
 if TYPE_CHECKING:
 	from collections.abc import Collection, Iterator, Mapping
@@ -30,6 +33,11 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_butler_configure_cache: PersistentLRUCache[tuple[object, ...], 'Mapping[str, Any]'] = (
+	PersistentLRUCache('itch_butler_configure', 10_000)
+)
+"""Output of butler configure, keyed by the arguments and the fingerprints of the receipt and the install folder, so it only gets run again once the game has been updated or something has been added/removed"""
+
 
 @lru_cache(maxsize=1)
 def _find_butler() -> Path | None:
@@ -47,10 +55,22 @@ def _find_butler() -> Path | None:
 def _butler_configure(
 	folder: Path, os_filter: str | None = None, *, ignore_arch: bool = False
 ) -> 'Mapping[str, Any] | None':
+	butler = _find_butler()
+	if not butler:
+		return None
+	cache_key = (
+		str(butler),
+		str(folder),
+		os_filter,
+		ignore_arch,
+		get_file_fingerprint(folder.joinpath('.itch', 'receipt.json.gz')),
+		get_file_fingerprint(folder),
+	)
+	cached = _butler_configure_cache.get(cache_key)
+	if cached is not None:
+		return cached
+
 	try:
-		butler = _find_butler()
-		if not butler:
-			return None
 		args: list[Path | str] = [butler, '-j', 'configure']
 		if os_filter:
 			args += ['--os-filter', os_filter]
@@ -66,6 +86,7 @@ def _butler_configure(
 		return None
 	else:
 		j: 'Mapping[str, Any]' = json.loads(butler_proc.stdout.splitlines()[-1])
+		_butler_configure_cache[cache_key] = j
 		return j
 
 
@@ -307,7 +328,10 @@ class ItchGame(Game):
 
 		make_launcher(params[0], self.name, info, 'itch.io', str(self.path))
 
-	def make_launcher(self) -> None:
+	@cached_property
+	def launch_candidates(self) -> 'Collection[tuple[str | None, Path, Mapping[str, bool] | None]]':
+		"""Candidates for executables from _try_and_find_exe, for our platform if there are any for that, or anything otherwise
+		Needs add_info to be called first so we know what platforms there are"""
 		os_filter = None
 		if 'linux' in self.platforms:
 			os_filter = 'linux'
@@ -317,7 +341,10 @@ class ItchGame(Game):
 		candidates = set(self._try_and_find_exe(os_filter))
 		if not candidates:
 			candidates = set(self._try_and_find_exe())
+		return candidates
 
+	def make_launcher(self) -> None:
+		candidates = self.launch_candidates
 		if not candidates:
 			# Warning and not info, because it's effectively telling you the game cannot be launched
 			logger.warning('No launch candidates found for %s')
@@ -331,6 +358,14 @@ class ItchGame(Game):
 			self._make_exe_launcher(flavour, path, windows_info)
 
 
+def find_launch_candidates(games: 'Collection[ItchGame]') -> None:
+	"""Gets launch_candidates for all these games at once, as butler takes a while for each game that doesn't already have its output cached, and can be run several times at once
+	Call add_info on them all first"""
+	with ThreadPoolExecutor(os.cpu_count()) as executor:
+		for _ in executor.map(lambda game: game.launch_candidates, games):
+			pass
+
+
 def get_launch_params(
 	flavour: str, exe_path: Path, windows_info: 'Mapping[str, bool] | None'
 ) -> tuple[LaunchCommand, str | None] | None:
@@ -33,7 +33,7 @@ class ArcadeGame(Game):
 		if self.machine.has_parent:
 			self.info.specific_info['Has Parent?'] = True
 
-		self.info.release_date = Date(self.machine.xml.findtext('year'))
+		self.info.release_date = Date(self.machine.year)
 
 		self.info.specific_info['Number of Players'] = self.machine.number_of_players
 		if self.machine.is_mechanical:
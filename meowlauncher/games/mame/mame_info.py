@@ -19,7 +19,7 @@ from meowlauncher.games.mame_common.mame_support_files import (
 	get_languages,
 	organize_catlist,
 )
-from meowlauncher.games.mame_common.mame_utils import image_config_keys, iter_cpus
+from meowlauncher.games.mame_common.mame_utils import image_config_keys
 from meowlauncher.util.detect_things_from_filename import (
 	get_languages_from_tags_directly,
 	get_regions_from_filename_tags,
@@ -189,10 +189,10 @@ def add_status(machine: Machine, game_info: 'GameInfo') -> None:
 	game_info.specific_info['MAME Overall Emulation Status'] = machine.overall_status
 	game_info.specific_info['MAME Emulation Status'] = machine.emulation_status
 	game_info.specific_info['Cocktail Status'] = machine.cocktail_status
-	driver = machine.driver_element
+	driver = machine.driver_attribs
 	savestate_status = None
 	if driver:
-		savestate_attrib = driver.attrib.get('savestate')
+		savestate_attrib = driver.get('savestate')
 		if (
 			savestate_attrib == 'supported'
 		):  # TODO: Why did the code have this, did something change in a new version and I forgot? I guess I'll need to find out, otherwise this could just check for 'unsupported'
@@ -391,8 +391,8 @@ def add_info(game: 'ArcadeGame') -> None:
 	with contextlib.suppress(FileNotFoundError):
 		add_history(game.info, game.machine.basename)
 
-	cpu_info = CPUInfo(CPU(cpu_xml) for cpu_xml in iter_cpus(game.machine.xml))
-	displays = DisplayCollection(game.machine.xml.iter('display'))
+	cpu_info = CPUInfo(CPU(cpu_xml) for cpu_xml in game.machine.cpu_elements)
+	displays = DisplayCollection(game.machine.display_elements)
 
 	game.info.specific_info['Number of CPUs'] = cpu_info.number_of_cpus
 	if cpu_info.number_of_cpus:
@@ -414,7 +414,7 @@ def add_info(game: 'ArcadeGame') -> None:
 
 def add_input_info(game: 'ArcadeGame') -> None:
 	game.info.input_info.set_inited()
-	if game.machine.input_element is None:
+	if not game.machine.has_input:
 		# Seems like this doesn't actually happen
 		logger.info('Oi m8 %s has no input', game.machine)
 		return
@@ -427,7 +427,7 @@ def add_input_info(game: 'ArcadeGame') -> None:
 
 	has_control_elements = False
 
-	for control in game.machine.input_element.iter('control'):
+	for control in game.machine.control_elements:
 		has_control_elements = True
 		buttons = int(control.attrib.get('buttons', 0))
 
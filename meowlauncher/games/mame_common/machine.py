@@ -1,14 +1,15 @@
+import itertools
 import re
-from collections.abc import Collection, Iterator, Mapping, Sequence
+from collections.abc import Collection, Iterable, Iterator, Mapping, Sequence
 from enum import Enum
-from functools import cache, cached_property
 from pathlib import PurePath
 from typing import TYPE_CHECKING, cast
 from xml.etree import ElementTree
 
 from meowlauncher.config import main_config
 from meowlauncher.data.emulated_platforms import all_mame_drivers
-from meowlauncher.util.name_utils import normalize_name
+from meowlauncher.util.name_utils import get_name_match_key, normalize_name
+from meowlauncher.util.persistent_cache import PersistentLRUCache, load_or_create_cached
 from meowlauncher.util.utils import (
 	find_filename_tags_at_end,
 	remove_capital_article,
@@ -22,7 +23,7 @@ from .mame_support_files import (
 	get_machine_cat,
 	organize_catlist,
 )
-from .mame_utils import consistentify_manufacturer, untangle_manufacturer
+from .mame_utils import consistentify_manufacturer, iter_cpus, untangle_manufacturer
 
 if TYPE_CHECKING:
 	from .mame import MAME
@@ -35,6 +36,8 @@ class MAMEStatus(Enum):
 
 
 class MediaSlot:
+	__slots__ = ('type', 'tag', 'fixed_image', 'mandatory', 'interface', 'instances', 'extensions')
+
 	def __init__(self, xml: ElementTree.Element):
 		self.type = xml.attrib.get('type')
 		self.tag = xml.attrib.get('tag')
@@ -62,16 +65,53 @@ _bootleg_with_publisher_regex = re.compile(r'^bootleg \((.+)\)$')
 
 
 class Machine:
+	"""Holds onto only the bits of the -listxml element that we actually use, as there are a lot of these and the whole element is quite big; anything else that is needed less often is obtained from the xml property, which gets the XML again"""
+
+	__slots__ = (
+		'_exe',
+		'basename',
+		'name',
+		'has_parent',
+		'parent_basename',
+		'_parent',
+		'alt_names',
+		'source_file',
+		'_romof',
+		'is_bios',
+		'is_mechanical',
+		'is_device',
+		'runnable',
+		'samples_used',
+		'year',
+		'manufacturer',
+		'coin_slots',
+		'number_of_players',
+		'has_input',
+		'control_elements',
+		'cpu_elements',
+		'display_elements',
+		'driver_attribs',
+		'feature_statuses',
+		'device_refs',
+		'requires_chds',
+		'_has_roms',
+		'_all_roms_nodump',
+		'media_slots',
+		'software_list_names',
+		'arcade_system',
+	)
+
 	def __init__(self, xml: ElementTree.Element, exe: 'MAME'):
-		"""We need the MAME executable this came from, so it can get the XML for the parent too"""
-		self.xml = xml
+		"""We need the MAME executable this came from, so it can get the XML for the parent too
+		xml is not kept around after this"""
 		self._exe = exe
+		attrib = xml.attrib
+		self.basename: str = attrib['name']
 		# This can't be a property because we might need to override it later, so stop trying to do that
-		name = self.xml.findtext('description', '')  # Blank name should not happen
 		# TODO: Name should be readonly
-		self.name = name
+		self.name: str = xml.findtext('description', '')  # Blank name should not happen
 
-		cloneof = self.xml.attrib.get('cloneof')
+		cloneof = attrib.get('cloneof')
 		self.has_parent: bool = False
 		self.parent_basename: str | None = None
 		if cloneof:
@@ -82,6 +122,74 @@ class Machine:
 		self.alt_names: set[
 			str
 		] = set()  # TODO: Only this class mutates this, meaning add_alternate_names should maybe be in the constructor instead, or return something, etc
+
+		self.source_file: str = PurePath(attrib['sourcefile']).stem
+		self._romof = attrib.get('romof')
+		self.is_bios: bool = attrib.get('isbios', 'no') == 'yes'
+		self.is_mechanical: bool = attrib.get('ismechanical', 'no') == 'yes'
+		self.is_device: bool = attrib.get('isdevice', 'no') == 'yes'
+		# TODO: To be honest I forgot what runnable does that isdevice doesn't do
+		self.runnable: bool = attrib.get('runnable', 'yes') == 'yes'
+		self.samples_used: str | None = attrib.get('sampleof')
+		self.year: str | None = xml.findtext('year')
+		self.manufacturer: str = (
+			xml.findtext('manufacturer') or ''
+		)  # Blank manufacturer should not happen
+
+		input_element = xml.find('input')
+		self.has_input = input_element is not None
+		self.control_elements: Sequence[ElementTree.Element] = ()
+		"""<control> elements inside <input>, these don't have children so it's not much to keep around"""
+		if input_element is not None:
+			self.coin_slots = int(input_element.attrib.get('coins', 0))
+			self.number_of_players = int(input_element.attrib.get('players', 0))
+			self.control_elements = tuple(input_element.iter('control'))
+		else:
+			# This would happen if we ended up loading a device or whatever, so let's not crash the whole dang program. Also, since you can't play a device, they have 0 players. But they won't have launchers anyway, this is just to stop the NoneType explosion.
+			self.coin_slots = 0
+			self.number_of_players = 0
+
+		driver_element = xml.find('driver')
+		self.driver_attribs: Mapping[str, str] | None = (
+			dict(driver_element.attrib) if driver_element is not None else None
+		)
+
+		features = {}
+		for feature in xml.iter('feature'):
+			feature_type = feature.attrib['type']
+			if 'status' in feature.attrib:
+				feature_status = feature.attrib['status']
+			elif 'overall' in feature.attrib:
+				# wat?
+				feature_status = feature.attrib['overall']
+			else:
+				continue
+
+			features[feature_type] = feature_status
+			# Known types according to DTD: protection, palette, graphics, sound, controls, keyboard, mouse, microphone, camera, disk, printer, lan, wan, timing
+			# Note: MAME 0.208 has added capture, media, tape, punch, drum, rom, comms; although because I have been somewhat clever in writing this code, I don't need to hardcode any of that anyway
+		self.feature_statuses: Mapping[str, str] = features
+
+		self.cpu_elements: Sequence[ElementTree.Element] = tuple(iter_cpus(xml))
+		self.display_elements: Sequence[ElementTree.Element] = tuple(xml.iter('display'))
+
+		self.device_refs: Collection[str] = frozenset(
+			device_ref.attrib['name'] for device_ref in xml.iter('device_ref')
+		)
+		# Hmm... should requires_chds include where all <disk> has status == "nodump"? e.g. Dragon's Lair has no CHD dump, would it be useful to say that it requires CHDs because it's supposed to have one but doesn't, or not, because you have a good romset without one
+		# I guess I should have a look at how the MAME inbuilt UI does this
+		self.requires_chds: bool = xml.find('disk') is not None
+		self._has_roms = xml.find('rom') is not None
+		self._all_roms_nodump = not any(
+			rom.attrib.get('status', 'good') != 'nodump' for rom in xml.iter('rom')
+		)
+		self.media_slots: Collection[MediaSlot] = frozenset(
+			MediaSlot(device_xml) for device_xml in xml.iter('device')
+		)
+		self.software_list_names: Collection[str] = frozenset(
+			software_list.attrib.get('name', '') for software_list in xml.iter('softwarelist')
+		)  # Blank name should not happen
+
 		self.arcade_system = arcade_system_names.get(self.source_file)
 		if not self.arcade_system:
 			self.arcade_system = arcade_system_bios_names.get(
@@ -91,7 +199,7 @@ class Machine:
 	def __str__(self) -> str:
 		return f'{self.basename} ({self.name})'
 
-	@cached_property
+	@property
 	def name_without_tags(self) -> str:
 		return remove_filename_tags(self.name)
 
@@ -133,13 +241,14 @@ class Machine:
 		self.name = primary_name
 
 	@property
-	def basename(self) -> str:
-		return self.xml.attrib['name']
+	def xml(self) -> ElementTree.Element:
+		"""The full -listxml element for this machine, for anything that isn't kept around. This gets it from MAME (or the disk cache) again every time, so hold onto it if you need it more than once"""
+		return self._exe.get_mame_xml(self.basename)
 
 	def __eq__(self, __o: object) -> bool:
 		if not isinstance(__o, Machine):
 			return False
-		return __o.basename == __o.basename
+		return __o.basename == self.basename
 
 	def __hash__(self) -> int:
 		return hash(self.basename)
@@ -153,10 +262,6 @@ class Machine:
 			self._parent = Machine(self._exe.get_mame_xml(self.parent_basename), self._exe)
 		return self._parent
 
-	@property
-	def is_bios(self) -> bool:
-		return self.xml.attrib.get('isbios', 'no') == 'yes'
-
 	@property
 	def family_basename(self) -> str:
 		return cast(str, self.parent_basename) if self.has_parent else self.basename
@@ -165,76 +270,29 @@ class Machine:
 	def family(self) -> 'Machine':
 		return cast(Machine, self.parent) if self.has_parent else self
 
-	@property
-	def source_file(self) -> str:
-		return PurePath(self.xml.attrib['sourcefile']).stem
-
-	@property
-	def is_mechanical(self) -> bool:
-		return self.xml.attrib.get('ismechanical', 'no') == 'yes'
-
-	@property
-	def input_element(self) -> ElementTree.Element | None:
-		return self.xml.find('input')
-
-	@property
-	def coin_slots(self) -> int:
-		return (
-			int(self.input_element.attrib.get('coins', 0)) if self.input_element is not None else 0
-		)
-
-	@property
-	def number_of_players(self) -> int:
-		if self.input_element is None:
-			# This would happen if we ended up loading a device or whatever, so let's not crash the whole dang program. Also, since you can't play a device, they have 0 players. But they won't have launchers anyway, this is just to stop the NoneType explosion.
-			return 0
-		return int(self.input_element.attrib.get('players', 0))
-
-	@property
-	def driver_element(self) -> ElementTree.Element | None:
-		return self.xml.find('driver')
-
 	@property
 	def overall_status(self) -> MAMEStatus | None:
 		"""Hmm, so how this works according to https://github.com/mamedev/mame/blob/master/src/frontend/mame/info.cpp: if any particular feature is preliminary, this is preliminary, if any feature is imperfect this is imperfect, unless protection = imperfect then this is preliminary
 		It even says it's for the convenience of frontend developers, but since I'm an ungrateful piece of shit and I always feel the need to take matters into my own hands, I'm gonna get the other parts of the emulation too"""
-		if self.driver_element is None:
+		if self.driver_attribs is None:
 			return None
-		return MAMEStatus(self.driver_element.attrib['status'])
+		return MAMEStatus(self.driver_attribs['status'])
 
 	@property
 	def emulation_status(self) -> MAMEStatus | None:
-		if self.driver_element is None:
+		if self.driver_attribs is None:
 			return None
-		return MAMEStatus(self.driver_element.attrib['emulation'])
+		return MAMEStatus(self.driver_attribs['emulation'])
 
 	@property
 	def cocktail_status(self) -> MAMEStatus | None:
-		if self.driver_element is None:
+		if self.driver_attribs is None:
 			return None
-		cocktail = self.driver_element.attrib.get('cocktail')
+		cocktail = self.driver_attribs.get('cocktail')
 		if not cocktail:
 			return None
 		return MAMEStatus(cocktail)
 
-	@property
-	def feature_statuses(self) -> Mapping[str, str]:
-		features = {}
-		for feature in self.xml.iter('feature'):
-			feature_type = feature.attrib['type']
-			if 'status' in feature.attrib:
-				feature_status = feature.attrib['status']
-			elif 'overall' in feature.attrib:
-				# wat?
-				feature_status = feature.attrib['overall']
-			else:
-				continue
-
-			features[feature_type] = feature_status
-			# Known types according to DTD: protection, palette, graphics, sound, controls, keyboard, mouse, microphone, camera, disk, printer, lan, wan, timing
-			# Note: MAME 0.208 has added capture, media, tape, punch, drum, rom, comms; although because I have been somewhat clever in writing this code, I don't need to hardcode any of that anyway
-		return features
-
 	@property
 	def is_probably_skeleton_driver(self) -> bool:
 		"""Actually, we're making an educated guess here, as MACHINE_IS_SKELETON doesn't appear directly in the XML...
@@ -247,26 +305,20 @@ class Machine:
 		)
 
 	def uses_device(self, name: str) -> bool:
-		return any(device_ref.attrib['name'] == name for device_ref in self.xml.iter('device_ref'))
-
-	@property
-	def requires_chds(self) -> bool:
-		"""Hmm... should this include where all <disk> has status == "nodump"? e.g. Dragon's Lair has no CHD dump, would it be useful to say that it requires CHDs because it's supposed to have one but doesn't, or not, because you have a good romset without one
-		I guess I should have a look at how the MAME inbuilt UI does this"""
-		return self.xml.find('disk') is not None
+		return name in self.device_refs
 
 	@property
 	def romless(self) -> bool:
 		if self.requires_chds:
 			return False
-		if self.xml.find('rom') is None:
+		if not self._has_roms:
 			return True
 
-		return not any(rom.attrib.get('status', 'good') != 'nodump' for rom in self.xml.iter('rom'))
+		return self._all_roms_nodump
 
 	@property
 	def bios_basename(self) -> str | None:
-		romof = self.xml.attrib.get('romof')
+		romof = self._romof
 		if self.has_parent and romof == self.family_basename:
 			return cast(Machine, self.parent).bios_basename
 		if romof:
@@ -280,37 +332,19 @@ class Machine:
 			return Machine(self._exe.get_mame_xml(bios_basename), self._exe)
 		return None
 
-	@property
-	def samples_used(self) -> str | None:
-		return self.xml.attrib.get('sampleof')
-
-	@property
-	def media_slots(self) -> Collection[MediaSlot]:
-		return {MediaSlot(device_xml) for device_xml in self.xml.iter('device')}
-
 	@property
 	def has_mandatory_slots(self) -> bool:
 		return any(slot.mandatory for slot in self.media_slots)
 
-	@property
-	def software_list_names(self) -> Collection[str]:
-		return {
-			software_list.attrib.get('name', '') for software_list in self.xml.iter('softwarelist')
-		}  # Blank name should not happen
-
-	@property
-	def manufacturer(self) -> str:
-		return self.xml.findtext('manufacturer') or ''  # Blank manufacturer should not happen
-
 	@property
 	def is_hack(self) -> bool:
 		return bool(self.hacked_by)
 
 	def _get_driver_bool_attrib(self, name: str, *, default: bool = False) -> bool:
-		if self.driver_element is None:
+		if self.driver_attribs is None:
 			# Should this ever happen anyway? Oh well the other code does it
 			return False
-		return self.driver_element.attrib.get(name, 'yes' if default else 'no') == 'yes'
+		return self.driver_attribs.get(name, 'yes' if default else 'no') == 'yes'
 
 	@property
 	def requires_artwork(self) -> bool:
@@ -425,15 +459,6 @@ class Machine:
 			tag.lower() in {'location test', 'prototype', 'development board'} for tag in tags
 		)
 
-	@property
-	def is_device(self) -> bool:
-		return self.xml.attrib.get('isdevice', 'no') == 'yes'
-
-	@property
-	def runnable(self) -> bool:
-		"""TODO: To be honest I forgot what this does that isdevice doesn't do"""
-		return self.xml.attrib.get('runnable', 'yes') == 'yes'
-
 	@property
 	def launchable(self) -> bool:
 		"""If this is logically possible to even be launched at all"""
@@ -522,9 +547,12 @@ def get_machine(driver: str, exe: 'MAME') -> Machine:
 
 
 def iter_machines_from_source_file(source_file: str, exe: 'MAME') -> Iterator[Machine]:
-	for machine_name, source_file_with_ext in exe.listsource():
-		if PurePath(source_file_with_ext).stem == source_file:
-			yield get_machine(machine_name, exe)
+	""":param source_file: Without directory or extension"""
+	machines = exe.source_file_map.get(source_file)
+	if not machines:
+		return
+	for _, xml in exe.get_mame_xmls([machine.basename for machine in machines]):
+		yield Machine(xml, exe)
 
 
 # TODO: This infodumping probably deserves to go somewhere in data - there would be a difference between "name of an arcade board that I think is interesting" and "particular arcade system that might have some different emulators for it etc etc"
@@ -918,13 +946,101 @@ def machine_name_matches(machine_name: str, game_name: str, match_vs_system: boo
 	return False
 
 
-@cache
+class MachineNameIndex:
+	"""Some machines indexed by get_name_match_key of their names and alternate names, to find the ones that does_machine_match_name would match without trying all of them
+	Only the basenames and names are indexed, so it can be pickled without any Machine objects in it (see for_source_files), and the Machine is only created again for the one that matches"""
+
+	def __init__(self, machines: Iterable[Machine]) -> None:
+		self._names: dict[str, tuple[str, frozenset[str]]] = {}
+		"""{basename: (name, alt names)}"""
+		self._basenames: dict[str, list[str]] = {}
+		self._vs_system_basenames: dict[str, list[str]] = {}
+		self._machines: dict[str, Machine] = {}
+		self._exe: 'MAME | None' = None
+		for machine in machines:
+			self._machines[machine.basename] = machine
+			self._names[machine.basename] = (machine.name, frozenset(machine.alt_names))
+			for name in {machine.name_without_tags, *machine.alt_names}:
+				self._add(self._basenames, get_name_match_key(name), machine.basename)
+				if name.upper().startswith('VS. '):
+					self._add(self._vs_system_basenames, get_name_match_key(name[4:]), machine.basename)
+
+	@classmethod
+	def for_source_files(cls, cache_name: str, source_files: Sequence[str], exe: 'MAME') -> 'MachineNameIndex':
+		"""Index of all the machines in these source files (without directory or extension), which is kept in the cache directory for this version of MAME, so we don't have to get the XML of every machine in them each time"""
+		index = load_or_create_cached(
+			cache_name,
+			(str(exe.exe_path), exe.version, tuple(source_files)),
+			lambda: cls(
+				itertools.chain.from_iterable(
+					iter_machines_from_source_file(source_file, exe) for source_file in source_files
+				)
+			),
+		)
+		index._exe = exe
+		return index
+
+	def __getstate__(self) -> tuple[object, ...]:
+		return self._names, self._basenames, self._vs_system_basenames
+
+	def __setstate__(self, state: tuple[object, ...]) -> None:
+		self._names, self._basenames, self._vs_system_basenames = cast(
+			tuple[dict[str, tuple[str, frozenset[str]]], dict[str, list[str]], dict[str, list[str]]], state
+		)
+		self._machines = {}
+		self._exe = None
+
+	@staticmethod
+	def _add(index: dict[str, list[str]], key: str, basename: str) -> None:
+		basenames = index.setdefault(key, [])
+		if basename not in basenames:
+			basenames.append(basename)
+
+	def _get_machine(self, basename: str) -> Machine | None:
+		machine = self._machines.get(basename)
+		if machine is None and self._exe:
+			machine = self._machines[basename] = get_machine(basename, self._exe)
+		return machine
+
+	def find_machine(self, name: str, *, match_vs_system: bool = False) -> Machine | None:
+		"""Returns the first machine (in the order they were given to the constructor) that does_machine_match_name, or None"""
+		index = self._vs_system_basenames if match_vs_system else self._basenames
+		for basename in index.get(get_name_match_key(name), ()):
+			machine_name, alt_names = self._names[basename]
+			if _do_machine_names_match(name, basename, machine_name, alt_names, match_vs_system):
+				return self._get_machine(basename)
+		return None
+
+
+_machine_name_match_cache: PersistentLRUCache[
+	tuple[str, str, frozenset[str], str, bool], bool
+] = PersistentLRUCache('mame_machine_name_matches', 100_000)
+
+
+def _do_machine_names_match(
+	name: str, basename: str, machine_name: str, alt_names: frozenset[str], match_vs_system: bool
+) -> bool:
+	key = (
+		basename,
+		machine_name,
+		alt_names,
+		normalize_name(remove_filename_tags(name)),
+		match_vs_system,
+	)
+	result = _machine_name_match_cache.get(key)
+	if result is None:
+		result = machine_name_matches(remove_filename_tags(machine_name), name, match_vs_system) or any(
+			machine_name_matches(remove_filename_tags(alt_name), name, match_vs_system)
+			for alt_name in alt_names
+		)
+		_machine_name_match_cache[key] = result
+	return result
+
+
 def does_machine_match_name(name: str, machine: Machine, match_vs_system: bool = False) -> bool:
 	"""game_name could have tags and they are removed here
+	Results are cached between runs, by the machine's names and the normalized game name
 	TODO: Where does this really belong?"""
-	if machine_name_matches(machine.name_without_tags, name, match_vs_system):
-		return True
-	return any(
-		machine_name_matches(remove_filename_tags(alt_name), name, match_vs_system)
-		for alt_name in machine.alt_names
+	return _do_machine_names_match(
+		name, machine.basename, machine.name, frozenset(machine.alt_names), match_vs_system
 	)
@@ -1,11 +1,13 @@
 import copy
 import logging
+import queue
 import re
 import subprocess
-from collections.abc import Iterator, Mapping, Sequence
+import threading
+from collections.abc import Collection, Iterator, Mapping, Sequence
 from functools import cached_property
 from pathlib import Path, PurePath
-from typing import cast
+from typing import NamedTuple
 from xml.etree import ElementTree
 
 from meowlauncher.common_paths import cache_dir
@@ -14,6 +16,7 @@ from meowlauncher.game import Game
 from meowlauncher.games.mame.mame_game import ArcadeGame
 from meowlauncher.games.mame.mame_inbuilt_game import MAMEInbuiltGame
 from meowlauncher.launch_command import LaunchCommand, rom_path_argument
+from meowlauncher.util.persistent_cache import load_or_create_cached
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +46,19 @@ class MAMEConfig(BaseEmulatorConfig):
 	Maybe it turns out _I'm_ the weird one for this being beneficial in my use case, and it shouldn't default to true? I dunno lol"""
 
 
+class SourceFileMachine(NamedTuple):
+	"""Just enough about a machine to know what source file it is in and who its family is, without keeping all of its XML around"""
+
+	basename: str
+	source_file: str
+	"""As it appears in -listxml/-listsource, with the extension and possibly a directory"""
+	cloneof: str | None
+	romof: str | None
+
+
+_ListXMLQueueItem = tuple[str, ElementTree.Element] | BaseException | None
+
+
 def _get_autoboot_script_by_name(name: str) -> Path:
 	# Hmm I'm not sure I like this one but whaddya do otherwise… where's otherwise a good place to store shit
 	mame_common = Path(__file__).parent
@@ -53,6 +69,9 @@ def _get_autoboot_script_by_name(name: str) -> Path:
 
 class MAME(Emulator[Game]):
 	# We are generic with Game instead of ArcadeGame here, as it is more versatile than that
+	_listxml_queue_size = 256
+	"""How many parsed machines the -listxml thread is allowed to get ahead of whatever is using them, so we don't end up with the whole thing in memory if that is slower"""
+
 	@classmethod
 	def exe_name(cls) -> str:
 		return 'mame'
@@ -74,6 +93,46 @@ class MAME(Emulator[Game]):
 		)
 		return version_proc.stdout.splitlines()[0]
 
+	def _listxml_worker(
+		self, machines: 'queue.Queue[_ListXMLQueueItem]', stop: threading.Event
+	) -> None:
+		"""Runs in a background thread for _real_iter_mame_entire_xml, so MAME producing the XML and us parsing it can happen while whatever is consuming the machines is doing its thing
+		Puts None when done, or the exception if something went wrong"""
+		try:
+			with subprocess.Popen(
+				[self.exe_path, '-listxml'], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+			) as proc:
+				# I'm doing what the documentation tells me to not do and effectively using proc.stdout.read
+				if not proc.stdout:
+					return
+				try:
+					for _, element in ElementTree.iterparse(proc.stdout):
+						if stop.is_set():
+							proc.kill()
+							return
+						if element.tag == 'machine':
+							my_copy = copy.copy(element)
+							machine_name = element.attrib['name']
+
+							if self.config.use_xml_disk_cache:
+								# The consumer may be getting a parent or BIOS out of the disk cache while we're still going, so don't let it see a half-written file
+								cache_file_path = self._xml_cache_path.joinpath(machine_name + '.xml')
+								temp_path = cache_file_path.with_suffix('.tmp')
+								temp_path.write_bytes(ElementTree.tostring(element))
+								temp_path.replace(cache_file_path)
+							machines.put((machine_name, my_copy))
+							element.clear()
+				except ElementTree.ParseError:
+					# Hmm, this doesn't show us where the error really is
+					logger.exception('baaagh XML error in listxml')
+			if self.config.use_xml_disk_cache:
+				# Guard against the -listxml process being interrupted and screwing up everything, by only manually specifying it is done when we say it is done (and we return early above if whatever was iterating stopped early)
+				self._xml_cache_path.joinpath('is_done').touch()
+		except BaseException as ex:  # noqa: BLE001 #Get it back to the main thread to be raised there
+			machines.put(ex)
+		finally:
+			machines.put(None)
+
 	def _real_iter_mame_entire_xml(self) -> Iterator[tuple[str, ElementTree.Element]]:
 		if self.config.use_xml_disk_cache:
 			logger.info(
@@ -82,30 +141,28 @@ class MAME(Emulator[Game]):
 			)
 			self._xml_cache_path.mkdir(exist_ok=True, parents=True)
 
-		with subprocess.Popen(
-			[self.exe_path, '-listxml'], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
-		) as proc:
-			# I'm doing what the documentation tells me to not do and effectively using proc.stdout.read
-			if not proc.stdout:
-				return
-			try:
-				for _, element in ElementTree.iterparse(proc.stdout):
-					if element.tag == 'machine':
-						my_copy = copy.copy(element)
-						machine_name = element.attrib['name']
-
-						if self.config.use_xml_disk_cache:
-							self._xml_cache_path.joinpath(machine_name + '.xml').write_bytes(
-								ElementTree.tostring(element)
-							)
-						yield machine_name, my_copy
-						element.clear()
-			except ElementTree.ParseError:
-				# Hmm, this doesn't show us where the error really is
-				logger.exception('baaagh XML error in listxml')
-		if self.config.use_xml_disk_cache:
-			# Guard against the -listxml process being interrupted and screwing up everything, by only manually specifying it is done when we say it is done… wait does this work if it's an iterator? I guess it must if this exists
-			self._xml_cache_path.joinpath('is_done').touch()
+		machines: 'queue.Queue[_ListXMLQueueItem]' = queue.Queue(self._listxml_queue_size)
+		stop = threading.Event()
+		worker = threading.Thread(
+			target=self._listxml_worker, args=(machines, stop), name='MAME -listxml', daemon=True
+		)
+		worker.start()
+		try:
+			while True:
+				item = machines.get()
+				if item is None:
+					break
+				if isinstance(item, BaseException):
+					raise item
+				yield item
+		finally:
+			stop.set()
+			# Unblock the worker if it's waiting for room in the queue, so it can notice it is meant to stop
+			while worker.is_alive():
+				try:
+					machines.get(timeout=0.1)
+				except queue.Empty:
+					pass
 
 	def _cached_iter_mame_entire_xml(self) -> Iterator[tuple[str, ElementTree.Element]]:
 		for cached_file in self._xml_cache_path.iterdir():
@@ -127,6 +184,8 @@ class MAME(Emulator[Game]):
 				return ElementTree.parse(cache_file_path).getroot()
 			except FileNotFoundError:
 				pass
+			except ElementTree.ParseError:
+				logger.info('Cached XML for %s is broken, getting it from MAME again', driver)
 
 		try:
 			proc = subprocess.run(
@@ -145,20 +204,82 @@ class MAME(Emulator[Game]):
 			)  # This shouldn't happen if -listxml didn't return success but eh
 		return xml
 
-	def listsource(self) -> Iterator[tuple[str, str]]:
+	def get_mame_xmls(self, drivers: Collection[str]) -> Iterator[tuple[str, ElementTree.Element]]:
+		"""Like get_mame_xml for several machines at once, but anything not in the disk cache is obtained with just one -listxml process instead of one per machine. Machines that MAME doesn't know about are skipped"""
+		remaining = set(drivers)
+		if self.config.use_xml_disk_cache:
+			for driver in drivers:
+				try:
+					yield driver, ElementTree.parse(self._xml_cache_path / (driver + '.xml')).getroot()
+				except (FileNotFoundError, ElementTree.ParseError):
+					continue
+				remaining.discard(driver)
+		if not remaining:
+			return
+
+		with subprocess.Popen(
+			[self.exe_path, '-listxml', *sorted(remaining)],
+			stdout=subprocess.PIPE,
+			stderr=subprocess.DEVNULL,
+		) as proc:
+			if not proc.stdout:
+				return
+			try:
+				for _, element in ElementTree.iterparse(proc.stdout):
+					if element.tag != 'machine':
+						continue
+					# This will also give us any devices they use, which nobody asked for
+					machine_name = element.attrib['name']
+					if machine_name in remaining:
+						yield machine_name, copy.copy(element)
+					element.clear()
+			except ElementTree.ParseError:
+				logger.exception('XML error in listxml for %s', remaining)
+
+	def _build_source_file_map(self) -> Mapping[str, Sequence[SourceFileMachine]]:
+		source_files: dict[str, list[SourceFileMachine]] = {}
+		for machine_name, xml in self.iter_mame_entire_xml():
+			source_file = xml.attrib.get('sourcefile')
+			if not source_file:
+				continue
+			source_files.setdefault(PurePath(source_file).stem, []).append(
+				SourceFileMachine(
+					machine_name, source_file, xml.attrib.get('cloneof'), xml.attrib.get('romof')
+				)
+			)
+		return source_files
+
+	@cached_property
+	def source_file_map(self) -> Mapping[str, Sequence[SourceFileMachine]]:
+		"""{source file without directory or extension: machines in that source file}
+		This is built from the entire -listxml the first time it is needed for this version of MAME (which also fills up the disk cache of machine XML if that is enabled), and then kept in the cache directory, so we don't need to run -listsource and then -listxml on each machine every time"""
+		return load_or_create_cached(
+			'mame_source_files', (str(self.exe_path), self.version), self._build_source_file_map
+		)
+
+	def _listfull(self) -> Collection[str]:
 		proc = subprocess.run(
-			[self.exe_path, '-listsource'],
+			[self.exe_path, '-listfull'],
 			stdout=subprocess.PIPE,
 			stderr=subprocess.DEVNULL,
 			text=True,
 			check=True,
 		)
-		# Return code should always be 0 so if it's not I dunno what to do about that and let's just panic instead
-		for line in proc.stdout.splitlines():
-			# Machine names and source files both shouldn't contain spaces, so this should be fine
-			line_split = line.split(maxsplit=2)
-			assert len(line_split) == 2, '-listsource output only one column???!! what'
-			yield cast(tuple[str, str], tuple(line_split))
+		# First line is the Name: Description: header
+		return frozenset(line.split(maxsplit=1)[0] for line in proc.stdout.splitlines()[1:] if line.strip())
+
+	@cached_property
+	def machine_basenames(self) -> Collection[str]:
+		"""Basenames of every machine, from -listfull, which is much quicker than going through the entire -listxml like source_file_map does if that isn't there yet; kept in the cache directory for this version of MAME"""
+		return load_or_create_cached(
+			'mame_machine_basenames', (str(self.exe_path), self.version), self._listfull
+		)
+
+	def listsource(self) -> Iterator[tuple[str, str]]:
+		"""Yields (machine basename, source file) for every machine, like -listsource would"""
+		for machines in self.source_file_map.values():
+			for machine in machines:
+				yield machine.basename, machine.source_file
 
 	def verifysoftlist(self, software_list_name: str) -> Iterator[str]:
 		# Unfortunately it seems we cannot verify an individual software, which would probably take less time
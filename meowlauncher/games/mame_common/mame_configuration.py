@@ -1,18 +1,25 @@
 import os
 import re
-from collections.abc import Collection, Mapping, Sequence
-from functools import cache
+from collections.abc import Iterable, Mapping, MutableMapping, Sequence
 from pathlib import Path
 
 image_types = {'ico', 'png', 'jpg', 'bmp'}
 
 
-@cache
-def _list_images_in_dir(path: Path) -> 'Collection[Path]':
+def _index_images_in_dir(path: Path, index: MutableMapping[str, Path], prefix: str = '') -> None:
+	"""Adds every image in this directory to index as {name without extension: path}, and for subdirectories (software list names), as {list name/software name: path}. Anything already in index is left alone, so earlier directories take priority"""
 	try:
-		return {file for file in path.iterdir() if file.suffix[1:].lower() in image_types}
-	except FileNotFoundError:
-		return []
+		with os.scandir(path) as it:
+			for entry in it:
+				if entry.is_dir():
+					if not prefix:
+						_index_images_in_dir(Path(entry.path), index, entry.name + '/')
+					continue
+				stem, ext = os.path.splitext(entry.name)
+				if ext[1:].lower() in image_types:
+					index.setdefault(prefix + stem, Path(entry.path))
+	except (FileNotFoundError, NotADirectoryError):
+		pass
 
 
 class MAMEConfiguration:
@@ -25,21 +32,28 @@ class MAMEConfiguration:
 		if not ui_config_path:
 			ui_config_path = Path('~/.mame/ui.ini').expanduser()
 		self.ui_config = parse_mame_config_file(ui_config_path)
-		self._icons = None
+		self._image_indexes: MutableMapping[str, Mapping[str, Path]] = {}
+
+	def get_image_index(self, config_key: str) -> Mapping[str, Path]:
+		"""Lists all the images in every directory for this ui.ini key (e.g. snapshot_directory) once, so we don't have to go poking around several directories and extensions for every single machine"""
+		index = self._image_indexes.get(config_key)
+		if index is None:
+			new_index: dict[str, Path] = {}
+			for directory in self.ui_config.get(config_key, ()):
+				_index_images_in_dir(Path(directory), new_index)
+			index = self._image_indexes[config_key] = new_index
+		return index
+
+	def build_image_indexes(self, config_keys: Iterable[str]) -> None:
+		"""Builds the index for each of these ui.ini keys up front, if you know you are going to want them all anyway"""
+		for config_key in config_keys:
+			self.get_image_index(config_key)
 
 	def get_image(
 		self, config_key: str, machine_or_list_name: str, software_name: str | None = None
 	) -> Path | None:
-		for directory in self.ui_config.get(config_key, ()):
-			directory_path = Path(directory)
-			basename = directory_path / machine_or_list_name
-			if software_name:
-				basename = basename / software_name
-			for ext in image_types:
-				path = basename.with_suffix(os.path.extsep + ext)
-				if path in _list_images_in_dir(basename.parent):
-					return path
-		return None
+		name = f'{machine_or_list_name}/{software_name}' if software_name else machine_or_list_name
+		return self.get_image_index(config_key).get(name)
 
 
 _mame_config_comment = re.compile(r'#.+$')
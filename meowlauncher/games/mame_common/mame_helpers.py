@@ -1,9 +1,9 @@
 """Use this file for handy shortcuts with the default MAME config/executable
 But also don't because relying on default_mame_executable is a bit ehh"""
-import functools
 from pathlib import Path
 
 from .mame_configuration import MAMEConfiguration
+from .mame_utils import image_config_keys
 
 default_mame_configuration: MAMEConfiguration | None
 try:
@@ -12,7 +12,12 @@ except FileNotFoundError:
 	default_mame_configuration = None
 
 
-@functools.cache
+def build_default_image_indexes() -> None:
+	"""Lists every artwork directory from ui.ini up front, for when we know we'll be getting images for a lot of things (e.g. every arcade machine)"""
+	if default_mame_configuration:
+		default_mame_configuration.build_image_indexes(image_config_keys.values())
+
+
 def get_image(
 	config_key: str, machine_or_list_name: str, software_name: str | None = None
 ) -> Path | None:
@@ -1,11 +1,15 @@
 import functools
+import mmap
 import os
+import re
 from collections.abc import Collection, Iterator, Mapping, MutableMapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 from xml.etree import ElementTree
+from xml.sax.saxutils import unescape
 
+from meowlauncher.util.persistent_cache import get_file_fingerprint, load_or_create_cached
 from meowlauncher.util.region_info import Language, get_language_by_english_name
 
 from .mame_helpers import default_mame_configuration
@@ -14,31 +18,96 @@ if TYPE_CHECKING:
 	from meowlauncher.info import GameInfo
 
 
+_history_entry_regex = re.compile(rb'<entry>.*?</entry>', re.DOTALL)
+_history_system_regex = re.compile(rb'<system\s([^>]*?)/?>')
+_history_item_regex = re.compile(rb'<item\s([^>]*?)/?>')
+_xml_attrib_regex = re.compile(rb'(\w+)="([^"]*)"')
+_history_text_regex = re.compile(rb'<text(?:\s[^>]*)?(?<!/)>(?!</text>)')
+"""<text> that isn't empty or self-closing"""
+_history_index_version = 2
+"""Change this if _index_history_xml would index things differently, so old indexes in the cache are not used"""
+
+_HistoryOffset = tuple[int, int]
+"""(start, length) of an <entry> in history.xml"""
+
+
+def _parse_history_xml_attribs(attribs: bytes) -> Mapping[str, str]:
+	return {
+		key.decode('utf-8'): unescape(value.decode('utf-8'), {'&quot;': '"', '&apos;': "'"})
+		for key, value in _xml_attrib_regex.findall(attribs)
+	}
+
+
+def _index_history_xml(
+	path: Path,
+) -> tuple[Mapping[str, _HistoryOffset], Mapping[str, Mapping[str, _HistoryOffset]]]:
+	"""Finds where each entry is without parsing any of the actual history text, which is the expensive part"""
+	system_offsets: dict[str, _HistoryOffset] = {}
+	software_offsets: dict[str, dict[str, _HistoryOffset]] = {}
+	with path.open('rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+		for entry_match in _history_entry_regex.finditer(mm):
+			offset = entry_match.start(), entry_match.end() - entry_match.start()
+			entry = entry_match[0]
+			if not _history_text_regex.search(entry):
+				# Nothing to show for this, and we don't want it to hide another entry for the same thing that does have text
+				continue
+			# Only look at the bit before the text, which is all the systems/software this is for
+			header = entry.partition(b'<text')[0]
+			for system_match in _history_system_regex.finditer(header):
+				name = _parse_history_xml_attribs(system_match[1]).get('name')
+				if name:
+					system_offsets[name] = offset
+			for item_match in _history_item_regex.finditer(header):
+				item_attribs = _parse_history_xml_attribs(item_match[1])
+				software_list = item_attribs.get('list')
+				name = item_attribs.get('name')
+				if software_list and name:
+					software_offsets.setdefault(software_list, {})[name] = offset
+	return system_offsets, software_offsets
+
+
 class HistoryXML:
-	def __init__(self, path: Path) -> None:
-		self.xml = ElementTree.parse(path)
+	"""history.xml is several megabytes, and we generally only want a few entries from it, so this just knows where each entry is and parses only the ones that are asked for
+	The index of where everything is gets stored in the cache directory, so it only needs to be built once whenever history.xml changes"""
 
-		system_histories: MutableMapping[str, History] = {}
-		software_histories: MutableMapping[str, MutableMapping[str, History]] = {}
-		for entry in self.xml.iter('entry'):
-			text = entry.findtext('text')
-			if not text:
-				continue
-			parsed = parse_history(text)
+	def __init__(self, path: Path) -> None:
+		self.path = path
+		fingerprint = get_file_fingerprint(path)
+		if not fingerprint:
+			raise FileNotFoundError(path)
+		self._fingerprint = fingerprint
+
+	@functools.cached_property
+	def _offsets(
+		self,
+	) -> tuple[Mapping[str, _HistoryOffset], Mapping[str, Mapping[str, _HistoryOffset]]]:
+		return load_or_create_cached(
+			'mame_history_xml_index',
+			(self._fingerprint, _history_index_version),
+			lambda: _index_history_xml(self.path),
+		)
 
-			systems = entry.find('systems')
-			if systems is not None:
-				system_histories.update(
-					(system.attrib['name'], parsed) for system in systems.iter('system')
-				)
-			softwares = entry.find('software')
-			if softwares is not None:
-				for item in softwares.iter('item'):
-					software_histories.setdefault(item.attrib['list'], {})[
-						item.attrib['name']
-					] = parsed
-		self.system_histories = system_histories
-		self.software_histories = software_histories
+	@functools.lru_cache(maxsize=128)
+	def _get_history_at(self, offset: _HistoryOffset) -> 'History | None':
+		start, length = offset
+		with self.path.open('rb') as f:
+			f.seek(start)
+			entry = ElementTree.fromstring(f.read(length))
+		text = entry.findtext('text')
+		if not text:
+			return None
+		return parse_history(text)
+
+	def get_system_history(self, basename: str) -> 'History | None':
+		offset = self._offsets[0].get(basename)
+		return self._get_history_at(offset) if offset else None
+
+	def get_software_history(self, software_list: str, software_name: str) -> 'History | None':
+		softlist_offsets = self._offsets[1].get(software_list)
+		if not softlist_offsets:
+			return None
+		offset = softlist_offsets.get(software_name)
+		return self._get_history_at(offset) if offset else None
 
 
 @functools.lru_cache(1)
@@ -171,12 +240,9 @@ def add_history(
 			)
 
 	if software_name:
-		softlist = history_xml.software_histories.get(machine_or_softlist)
-		if not softlist:
-			return
-		history = softlist.get(software_name)
+		history = history_xml.get_software_history(machine_or_softlist, software_name)
 	else:
-		history = history_xml.system_histories.get(machine_or_softlist)
+		history = history_xml.get_system_history(machine_or_softlist)
 
 	if not history:
 		return
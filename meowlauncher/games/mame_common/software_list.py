@@ -1,9 +1,10 @@
 import contextlib
+import hashlib
 import itertools
 import logging
 import re
 import zlib
-from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
+from collections.abc import Callable, Collection, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from enum import Enum
 from functools import cache, cached_property
@@ -14,7 +15,7 @@ from xml.etree import ElementTree
 import meowlauncher
 from meowlauncher.common_types import EmulationStatus
 from meowlauncher.info import Date, GameInfo
-from meowlauncher.util.name_utils import normalize_name
+from meowlauncher.util.name_utils import get_name_match_key, normalize_name
 from meowlauncher.util.utils import find_filename_tags_at_end, find_tags
 
 from .mame_helpers import default_mame_configuration, get_image
@@ -573,6 +574,19 @@ class SoftwareList:
 		# return None
 		return self.software.get(name)
 
+	@cached_property
+	def _parts_by_name_match_key(self) -> Mapping[str, Sequence[SoftwarePart]]:
+		index: dict[str, list[SoftwarePart]] = {}
+		for software in self.software.values():
+			index.setdefault(get_name_match_key(software.description), []).extend(
+				software.parts.values()
+			)
+		return index
+
+	def iter_parts_with_name_match_key(self, name: str) -> Iterator[SoftwarePart]:
+		"""Parts of software that might fuzzily match name (because they have the same get_name_match_key), to narrow things down before comparing them more thoroughly"""
+		yield from self._parts_by_name_match_key.get(get_name_match_key(name), ())
+
 	def iter_all_parts_with_custom_matcher(
 		self, matcher: SoftwareCustomMatcher, args: Sequence[Any]
 	) -> Iterator[SoftwarePart]:
@@ -726,12 +740,12 @@ def _does_name_fuzzy_match(part: SoftwarePart, name: str) -> bool:
 
 
 def find_software_by_name(software_lists: Collection[SoftwareList], name: str) -> Software | None:
-	fuzzy_name_matches = set(
-		itertools.chain.from_iterable(
-			software_list.iter_all_software_with_custom_matcher(_does_name_fuzzy_match, [name])
-			for software_list in software_lists
-		)
-	)
+	fuzzy_name_matches = {
+		part.software
+		for software_list in software_lists
+		for part in software_list.iter_parts_with_name_match_key(name)
+		if _does_name_fuzzy_match(part, name)
+	}
 
 	if len(fuzzy_name_matches) == 1:
 		# TODO: Don't do this, we still need to check the region… but only if the region needs to be checked at all, see below comment
@@ -833,3 +847,18 @@ def matcher_args_for_bytes(data: bytes) -> SoftwareMatcherArgs:
 	return SoftwareMatcherArgs(
 		zlib.crc32(data), None, len(data), lambda offset, amount: data[offset : offset + amount]
 	)
+
+
+def matcher_args_for_chunks(
+	chunks: Iterable[bytes], reader: 'Callable[[int, int], bytes] | None'
+) -> SoftwareMatcherArgs:
+	"""Like matcher_args_for_bytes, but hashes the data a piece at a time as it comes in, so it never needs to be all in memory at once
+	:param reader: Reads from the same data as chunks, for software with multiple ROMs in the data area"""
+	crc32 = 0
+	sha1 = hashlib.sha1()
+	size = 0
+	for chunk in chunks:
+		crc32 = zlib.crc32(chunk, crc32)
+		sha1.update(chunk)
+		size += len(chunk)
+	return SoftwareMatcherArgs(crc32, sha1.digest(), size, reader)
@@ -3,6 +3,7 @@ import logging
 import zlib
 from abc import ABC, abstractmethod
 from collections.abc import Collection, Iterator, MutableMapping
+from contextlib import contextmanager
 from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -10,8 +11,17 @@ from typing import TYPE_CHECKING
 from pydantic import ByteSize
 
 from meowlauncher.config import current_config
-from meowlauncher.games.mame_common.software_list import SoftwareMatcherArgs, find_in_software_lists
+from meowlauncher.games.mame_common.software_list import (
+	SoftwareMatcherArgs,
+	find_in_software_lists,
+	matcher_args_for_chunks,
+)
 from meowlauncher.util import archives, cd_read, io_utils
+from meowlauncher.util.persistent_cache import (
+	FileFingerprint,
+	PersistentLRUCache,
+	get_file_fingerprint,
+)
 from meowlauncher.util.utils import byteswap
 
 from .roms_config import ROMsConfig
@@ -23,6 +33,11 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 max_size_for_slurp = current_config(ROMsConfig).max_size_for_storing_in_memory
 
+_range_hash_cache: PersistentLRUCache[
+	tuple[FileFingerprint, int, int], tuple[int | None, bytes | None, int | None]
+] = PersistentLRUCache('rom_range_hashes', 50_000)
+"""{(fingerprint, start, end): (crc32, sha1, size)} from FileROM.get_matcher_args_for_range"""
+
 
 class ROM(ABC):
 	"""Base abstract class for all kinds of ROMs"""
@@ -101,6 +116,8 @@ class FileROM(ROM):
 		self._entire_file: bytes = b''
 		self._crc32: int | None = None
 		self.header_length_for_crc_calculation: int = 0
+		self._windows: list[tuple[int, int, bytes]] = []
+		"""(start, end, data) from buffer_windows, data may be shorter than end - start if the file is"""
 
 	@property
 	def should_read_whole_thing(self) -> bool:
@@ -119,13 +136,81 @@ class FileROM(ROM):
 	def _read(self, seek_to: int = 0, amount: int = -1) -> bytes:
 		return io_utils.read_file(self.path, seek_to, amount)
 
+	def _read_head_and_tail(self, head_size: int, tail_size: int) -> tuple[bytes, bytes]:
+		with self.path.open('rb') as f:
+			head = f.read(head_size)
+			if not tail_size:
+				return head, b''
+			f.seek(max(self.size - tail_size, 0))
+			return head, f.read(tail_size)
+
+	@contextmanager
+	def buffer_windows(self, head_size: int, tail_size: int = 0) -> Iterator[None]:
+		"""Reads the first head_size bytes and the last tail_size bytes now, so that read() calls inside those areas are served from memory instead of opening the file again each time, for when we are probing a few places for a header
+		They are thrown away again afterwards so we aren't holding onto them for every ROM. Does nothing if the whole file is stored in memory anyway"""
+		if self._store_entire_file:
+			yield
+			return
+		head, tail = self._read_head_and_tail(head_size, tail_size)
+		self._windows = [(0, head_size, head)]
+		if tail_size:
+			tail_start = max(self.size - tail_size, 0)
+			self._windows.append((tail_start, tail_start + tail_size, tail))
+		try:
+			yield
+		finally:
+			self._windows = []
+
 	def read(self, seek_to: int = 0, amount: int = -1) -> bytes:
 		if self._store_entire_file:
 			if amount == -1:
 				return self._entire_file[seek_to:]
 			return self._entire_file[seek_to : seek_to + amount]
+		if amount != -1:
+			for start, end, window in self._windows:
+				if start <= seek_to and seek_to + amount <= end:
+					return window[seek_to - start : seek_to - start + amount]
 		return self._read(seek_to, amount)
 
+	def iter_chunks(self, seek_to: int = 0, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+		"""Reads from seek_to to the end in pieces of chunk_size, for hashing or such without having all of a large ROM in memory at once"""
+		if self._store_entire_file:
+			yield self._entire_file[seek_to:]
+			return
+		with self.path.open('rb') as f:
+			f.seek(seek_to)
+			while chunk := f.read(chunk_size):
+				yield chunk
+
+	def _iter_range(self, start: int, end: int) -> Iterator[bytes]:
+		remaining = end - start
+		for chunk in self.iter_chunks(start):
+			if remaining <= 0:
+				break
+			yield chunk[:remaining]
+			remaining -= len(chunk)
+
+	def get_matcher_args_for_range(self, start: int = 0, end: int | None = None) -> SoftwareMatcherArgs:
+		"""Software matcher args for only the bytes from start to end (or the end of the file), for when there is a header or footer that is not part of what the software list has
+		Hashes are computed a chunk at a time, and kept between runs until the file changes"""
+		if end is None:
+			end = self.size
+
+		def _range_reader(offset: int, amount: int) -> bytes:
+			offset += start
+			return self.read(seek_to=offset, amount=max(min(amount, end - offset), 0))
+
+		fingerprint = get_file_fingerprint(self.path)
+		cache_key = (fingerprint, start, end) if fingerprint else None
+		cached = _range_hash_cache.get(cache_key) if cache_key else None
+		if cached:
+			return SoftwareMatcherArgs(*cached, _range_reader)
+
+		args = matcher_args_for_chunks(self._iter_range(start, end), _range_reader)
+		if cache_key:
+			_range_hash_cache[cache_key] = args.crc32, args.sha1, args.size
+		return args
+
 	def _get_size(self) -> ByteSize:
 		return super().size
 
@@ -218,6 +303,15 @@ class CompressedROM(FileROM):
 	def _read(self, seek_to: int = 0, amount: int = -1) -> bytes:
 		return archives.compressed_get(self.path, self.inner_filename, seek_to, amount)
 
+	def _read_head_and_tail(self, head_size: int, tail_size: int) -> tuple[bytes, bytes]:
+		# Getting anything out of an archive means decompressing from the start anyway, so just do that once
+		data = self._read()
+		return data[:head_size], data[-tail_size:] if tail_size else b''
+
+	def iter_chunks(self, seek_to: int = 0, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+		# Can't really stream out of an archive, so it'll just have to be one big chunk
+		yield self.read(seek_to)
+
 	def _get_size(self) -> ByteSize:
 		return archives.compressed_getsize(self.path, self.inner_filename)
 
@@ -251,6 +345,9 @@ class GCZFileROM(FileROM):
 	def read(self, seek_to: int = 0, amount: int = -1) -> bytes:
 		return cd_read.read_gcz(self.path, seek_to, amount)
 
+	def iter_chunks(self, seek_to: int = 0, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+		yield self.read(seek_to)
+
 	@property
 	def crc32(self) -> int:
 		raise NotImplementedError('Trying to hash a .gcz file is silly and should not be done')
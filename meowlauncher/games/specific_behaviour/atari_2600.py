@@ -1,4 +1,6 @@
 import hashlib
+import logging
+import shutil
 import subprocess
 from functools import cache
 from pathlib import Path
@@ -12,6 +14,7 @@ from meowlauncher.games.mame_common.software_list import (
 )
 from meowlauncher.games.roms.rom import FileROM
 from meowlauncher.platform_types import Atari2600Controller
+from meowlauncher.util.persistent_cache import get_file_fingerprint, load_from_cache, save_to_cache
 from meowlauncher.util.region_info import TVSystem
 
 from .common import atari_controllers as controllers
@@ -22,9 +25,13 @@ if TYPE_CHECKING:
 	from meowlauncher.games.roms.rom_game import ROMGame
 	from meowlauncher.info import GameInfo
 
+logger = logging.getLogger(__name__)
+
+_stella_database_cache_version = 1
+"""Change this if _list_stella_rom_info changes what it returns"""
+
 #Not gonna use stella -rominfo on individual stuff as it takes too long and just detects TV type with no other useful info that isn't in the -listrominfo db
-@cache
-def get_stella_database(exe: Path) -> 'Mapping[str, Mapping[str, str]]':
+def _list_stella_rom_info(exe: Path) -> 'Mapping[str, Mapping[str, str]]':
 	proc = subprocess.run([exe, '-listrominfo'], stdout=subprocess.PIPE, text=True, check=True)
 
 	lines = proc.stdout.splitlines()
@@ -51,6 +58,37 @@ def get_stella_database(exe: Path) -> 'Mapping[str, Mapping[str, str]]':
 
 	return games
 
+@cache
+def get_stella_database(exe: Path) -> 'Mapping[str, Mapping[str, str]]':
+	"""Returns {MD5: properties} from stella -listrominfo, which is saved in the cache directory along with the fingerprint of the Stella executable, and only run again if Stella is updated
+	If Stella can't be found, whatever was saved last time is used, so it can also just be copied from another computer"""
+	exe_path = shutil.which(exe)
+	fingerprint = get_file_fingerprint(Path(exe_path)) if exe_path else None
+	cached = load_from_cache('stella_database', _stella_database_cache_version)
+	if cached:
+		cached_fingerprint, cached_database = cached
+		if fingerprint is None:
+			logger.info('Could not find %s, using Stella database saved from %s', exe, cached_fingerprint[0])
+			return cached_database
+		if cached_fingerprint == fingerprint:
+			return cached_database
+	elif fingerprint is None:
+		logger.warning('Could not find %s and no Stella database has been saved', exe)
+		return {}
+
+	database = _list_stella_rom_info(exe)
+	save_to_cache('stella_database', _stella_database_cache_version, (fingerprint, database))
+	return database
+
+@cache
+def _get_stella_exe() -> Path:
+	"""Whatever Stella is configured as in emulators.ini, or just stella from $PATH"""
+	# Importing this at the top would be circular, as it imports everything that has emulator command lines
+	from meowlauncher.data.emulators import standalone_emulators_by_name
+
+	stella = standalone_emulators_by_name.get('Stella')
+	return stella().exe_path if stella else Path('stella')
+
 def _controller_from_stella_db_name(controller: str) -> Atari2600Controller:
 	if controller in {'JOYSTICK', 'AUTO'}:
 		return Atari2600Controller.Joystick
@@ -227,7 +265,7 @@ def _parse_peripherals(metadata: 'GameInfo') -> None:
 		_add_input_info_from_peripheral(metadata, right)
 
 def add_atari_2600_custom_info(game: 'ROMGame') -> None:
-	stella_db = get_stella_database(_stella_configs.exe_path)
+	stella_db = get_stella_database(_get_stella_exe())
 
 	whole_cart = cast(FileROM, game.rom).read()
 	if stella_db:
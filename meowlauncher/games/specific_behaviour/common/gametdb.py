@@ -11,9 +11,15 @@ logger = logging.getLogger(__name__)
 
 
 class TDB:
-	def __init__(self, xml: ElementTree.ElementTree):
-		self.xml = xml
-
+	def __init__(self, xml: ElementTree.ElementTree | ElementTree.Element):
+		self.games: dict[str, ElementTree.Element] = {}
+		"""<game> elements by <id>, we only hold onto these and not the whole document, so this can be pickled without too much junk"""
+		for game in xml.iter('game'):
+			game_id = game.findtext('id')
+			if game_id:
+				self.games.setdefault(game_id, game)
+
+		self.genres: dict[str, list[str]] = {}
 		genre_element = xml.find('genres')
 		if genre_element is None:
 			return
@@ -26,9 +32,7 @@ class TDB:
 		}
 
 	def find_game(self, search_key: str) -> ElementTree.Element | None:
-		return next(
-			(game for game in self.xml.iter('game') if game.findtext('id') == search_key), None
-		)
+		return self.games.get(search_key)
 
 	def _organize_genres(self, genres: Collection[str]) -> Mapping[str, Collection[str]]:
 		main_genres: dict[str, set[str]] = {}
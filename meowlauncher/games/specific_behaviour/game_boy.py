@@ -6,11 +6,7 @@ from zlib import crc32
 
 from meowlauncher import input_info
 from meowlauncher.common_types import SaveType
-from meowlauncher.games.mame_common.software_list import (
-	Software,
-	find_in_software_lists,
-	matcher_args_for_bytes,
-)
+from meowlauncher.games.mame_common.software_list import Software, find_in_software_lists
 from meowlauncher.games.roms.rom import FileROM
 from meowlauncher.platform_types import GameBoyColourFlag
 from meowlauncher.settings.platform_config import platform_configs
@@ -257,21 +253,22 @@ def add_game_boy_custom_info(game: 'ROMGame') -> None:
 	game.info.input_info.add_option(builtin_gamepad)
 
 	rom = cast(FileROM, game.rom)
-	header = rom.read(seek_to=0x100, amount=0x50)
-	_parse_gameboy_header(game.info, header)
+	with rom.buffer_windows(0x150, 64 if game.rom.extension == 'gbx' else 0):
+		header = rom.read(seek_to=0x100, amount=0x50)
+		_parse_gameboy_header(game.info, header)
 
-	if _game_boy_config and _game_boy_config.options.get('set_gbc_as_different_platform') and (
-		game.rom.extension == 'gbc'
-		or game.info.specific_info.get('Is Colour?') == GameBoyColourFlag.Required
-	):
-		game.info.platform = 'Game Boy Color'
+		if _game_boy_config and _game_boy_config.options.get('set_gbc_as_different_platform') and (
+			game.rom.extension == 'gbc'
+			or game.info.specific_info.get('Is Colour?') == GameBoyColourFlag.Required
+		):
+			game.info.platform = 'Game Boy Color'
 
-	if game.rom.extension == 'gbx':
-		_parse_gbx_footer(rom, game.info)
+		if game.rom.extension == 'gbx':
+			_parse_gbx_footer(rom, game.info)
 
 	if game.rom.extension == 'gbx':
 		software = find_in_software_lists(
-			game.related_software_lists, matcher_args_for_bytes(rom.read(amount=rom.size - 64))
+			game.related_software_lists, rom.get_matcher_args_for_range(end=rom.size - 64)
 		)
 	else:
 		software = game.get_software_list_entry()
@@ -231,8 +231,10 @@ def add_sms_gg_software_list_info(software: 'Software', metadata: 'GameInfo') ->
 
 
 def add_sms_gg_rom_file_info(rom: 'FileROM', metadata: 'GameInfo') -> None:
-	sdsc_header = rom.read(seek_to=0x7FE0, amount=16)
-	if sdsc_header[:4] == b'SDSC':
-		parse_sdsc_header(rom, metadata, sdsc_header[4:])
+	# Covers the SDSC header and the strings it points to, and all the standard header locations
+	with rom.buffer_windows(0x10100):
+		sdsc_header = rom.read(seek_to=0x7FE0, amount=16)
+		if sdsc_header[:4] == b'SDSC':
+			parse_sdsc_header(rom, metadata, sdsc_header[4:])
 
-	add_info_from_standard_header(rom, metadata)
+		add_info_from_standard_header(rom, metadata)
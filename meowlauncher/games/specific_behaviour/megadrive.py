@@ -3,17 +3,12 @@ import re
 from collections.abc import Collection
 from datetime import datetime
 from functools import lru_cache
-from itertools import chain
 from typing import TYPE_CHECKING, Any
 
 from meowlauncher import input_info
 from meowlauncher.common_types import SaveType
 from meowlauncher.games.common.generic_info import add_generic_software_info
-from meowlauncher.games.mame_common.machine import (
-	Machine,
-	does_machine_match_name,
-	iter_machines_from_source_file,
-)
+from meowlauncher.games.mame_common.machine import Machine, MachineNameIndex
 from meowlauncher.games.mame_common.mame import MAME
 from meowlauncher.games.roms.rom import FileROM
 from meowlauncher.info import Date, GameInfo
@@ -244,38 +239,19 @@ def _get_smd_header(rom: FileROM) -> bytes:
 
 
 @lru_cache(maxsize=1)
-def _get_megaplay_games() -> Collection[Machine]:
+def _get_mega_drive_arcade_name_index() -> MachineNameIndex:
+	"""Mega-Tech, Mega Play, and bootleg arcade boards running Mega Drive games"""
 	mame = MAME()
 	if not mame.is_available:
-		return []
-	return frozenset(iter_machines_from_source_file('megaplay', mame))
-
-
-@lru_cache(maxsize=1)
-def _get_megatech_games() -> Collection[Machine]:
-	mame = MAME()
-	if not mame.is_available:
-		return []
-	return frozenset(iter_machines_from_source_file('megatech', mame))
-
-
-@lru_cache(maxsize=1)
-def _get_megadrive_arcade_bootlegs() -> Collection[Machine]:
-	mame = MAME()
-	if not mame.is_available:
-		return []
-	return set(iter_machines_from_source_file('megadriv_acbl', mame))
+		return MachineNameIndex(())
+	return MachineNameIndex.for_source_files(
+		'mega_drive_arcade_name_index', ('megatech', 'megaplay', 'megadriv_acbl'), mame
+	)
 
 
 def find_equivalent_mega_drive_arcade(game_name: str) -> Machine | None:
 	# TODO: Maybe StandardEmulatedPlatform can just hold some field called "potentially_equivalent_machines" or is that stupid? Yeah maybe just have a function yielding them
-	for machine in chain(
-		_get_megatech_games(), _get_megaplay_games(), _get_megadrive_arcade_bootlegs()
-	):
-		if does_machine_match_name(game_name, machine):
-			return machine
-
-	return None
+	return _get_mega_drive_arcade_name_index().find_machine(game_name)
 
 
 def add_megadrive_software_list_metadata(software: 'Software', game_info: GameInfo) -> None:
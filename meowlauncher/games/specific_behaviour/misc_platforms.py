@@ -9,14 +9,14 @@ from meowlauncher.common_types import ByteAmount, MediaType
 from meowlauncher.games.common.generic_info import add_generic_software_info
 from meowlauncher.games.mame_common.machine import (
 	Machine,
-	does_machine_match_name,
+	MachineNameIndex,
 	iter_machines_from_source_file,
 )
 from meowlauncher.games.mame_common.mame import MAME
 from meowlauncher.games.roms.rom import FileROM
 
 if TYPE_CHECKING:
-	from collections.abc import Collection, Sequence
+	from collections.abc import Sequence
 
 	from meowlauncher.games.mame_common.software_list import Software
 	from meowlauncher.games.roms.rom_game import ROMGame
@@ -220,15 +220,12 @@ def add_pet_info_from_filename_tags(tags: 'Sequence[str]', game_info: 'GameInfo'
 
 
 @lru_cache(maxsize=1)
-def _get_uapce_games() -> 'Collection[Machine]':
+def _get_uapce_games() -> MachineNameIndex:
 	mame = MAME()
 	if not mame.is_available:
-		return []
-	return frozenset(iter_machines_from_source_file('uapce', mame))
+		return MachineNameIndex(())
+	return MachineNameIndex(iter_machines_from_source_file('uapce', mame))
 
 
 def find_equivalent_pc_engine_arcade(game_name: str) -> Machine | None:
-	for uapce_machine in _get_uapce_games():
-		if does_machine_match_name(game_name, uapce_machine):
-			return uapce_machine
-	return None
+	return _get_uapce_games().find_machine(game_name)
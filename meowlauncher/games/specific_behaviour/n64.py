@@ -3,12 +3,18 @@ import logging
 from configparser import ParsingError
 from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, NamedTuple, cast
 
 from meowlauncher import input_info
 from meowlauncher.common_types import SaveType
 from meowlauncher.games.common.generic_info import add_generic_software_info
 from meowlauncher.games.roms.rom import FileROM
+from meowlauncher.util.persistent_cache import (
+	FileFingerprint,
+	PersistentLRUCache,
+	get_file_fingerprint,
+	load_or_create_cached,
+)
 from meowlauncher.util.utils import (
 	NoNonsenseConfigParser,
 	NotAlphanumericError,
@@ -24,6 +30,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_md5_cache: PersistentLRUCache[FileFingerprint, str] = PersistentLRUCache('n64_md5', 20_000)
+"""Z64 format MD5 of each ROM we have looked at, as hashing a whole 64MB ROM every time is a bit much"""
+
 def _get_mupen64plus_database_location() -> Path | None:
 	config_location = Path('~/.config/mupen64plus/mupen64plus.cfg').expanduser()
 	try:
@@ -46,32 +55,53 @@ def _get_mupen64plus_database_location() -> Path | None:
 
 	return None
 
+class _Mupen64PlusDatabase(NamedTuple):
+	"""mupen64plus.ini with RefMD5 already resolved, so each entry has everything from the entry it refers to as well"""
+	by_md5: 'Mapping[str, Mapping[str, str]]'
+	by_crc: 'Mapping[str, Mapping[str, str]]'
+	"""Keyed by the CRC key of each entry (the two checksums in the ROM header, as uppercase hex separated by a space), which is the first entry with that CRC if there is more than one"""
+
+def _parse_mupen64plus_database(location: Path) -> _Mupen64PlusDatabase:
+	""":raises ParsingError: If it is not a valid ini"""
+	parser = NoNonsenseConfigParser(comment_prefixes=';')
+	parser.read(location)
+	#Turn it into plain dicts, partly because we can't pickle the parser, and also the .items method is different
+	sections = {name: dict(section) for name, section in parser.items() if name != parser.default_section}
+
+	by_md5: dict[str, dict[str, str]] = {}
+	def resolve(md5: str, seen: frozenset[str]) -> dict[str, str]:
+		entry = by_md5.get(md5)
+		if entry is not None:
+			return entry
+		entry = dict(sections[md5])
+		parent_md5 = entry.get('RefMD5')
+		if parent_md5 in sections and parent_md5 not in seen:
+			for parent_key, parent_value in resolve(parent_md5, seen | {md5}).items():
+				entry.setdefault(parent_key, parent_value)
+		by_md5[md5] = entry
+		return entry
+
+	by_crc: dict[str, dict[str, str]] = {}
+	for md5 in sections:
+		entry = resolve(md5, frozenset())
+		crc = entry.get('CRC')
+		if crc:
+			by_crc.setdefault(crc.upper(), entry)
+	return _Mupen64PlusDatabase(by_md5, by_crc)
+
 @lru_cache(maxsize=1)
-def _get_mupen64plus_database() -> 'Mapping[str, Mapping[str, str]] | None':
+def _get_mupen64plus_database() -> _Mupen64PlusDatabase | None:
+	"""Parsed once and then kept in the cache directory until mupen64plus.ini changes"""
 	location = _get_mupen64plus_database_location()
 	if not location:
 		return None
 
 	try:
-		parser = NoNonsenseConfigParser(comment_prefixes=';')
-		parser.read(location)
+		return load_or_create_cached('mupen64plus_database', get_file_fingerprint(location), lambda: _parse_mupen64plus_database(location))
 	except ParsingError:
 		logger.exception('Uh oh could not read Mupen64Plus database from %s', location)
 		return None
 
-	database = dict(parser) #I guess it doesn't work if we just hold onto it directly, well for starters the .items method is different
-	for keypairs in database.values():
-		if 'RefMD5' in keypairs:
-			parent_md5 = keypairs['RefMD5']
-			if parent_md5 in database:
-				parent = database[parent_md5]
-				for parent_key, parent_value in parent.items():
-					if parent_key in keypairs:
-						continue
-					keypairs[parent_key] = parent_value
-
-	return database
-
 def _parse_n64_header(metadata: 'GameInfo', header: bytes) -> None:
 	#Clock rate, apparently? 0:4
 	#Program counter: 4-8
@@ -126,10 +156,27 @@ def _add_info_from_database_entry(metadata: 'GameInfo', database_entry: 'Mapping
 		metadata.specific_info['Uses Transfer Pak?'] = True
 	#Unfortunately nothing in here which specifies to use VRU, or any other weird fancy controllers which may or may not exist
 
+def _get_z64_md5(rom: FileROM, *, is_byteswapped: bool) -> str:
+	"""MD5 of the ROM in Z64 (big endian) format, which is what mupen64plus.ini uses, as uppercase hex"""
+	fingerprint = get_file_fingerprint(rom.path)
+	if fingerprint:
+		cached = _md5_cache.get(fingerprint)
+		if cached:
+			return cached
+	md5 = hashlib.md5(usedforsecurity=False)
+	for chunk in rom.iter_chunks():
+		#Chunks are of even size (except maybe the last one), so swapping each chunk works out the same as swapping the whole thing
+		md5.update(byteswap(chunk) if is_byteswapped else chunk)
+	rom_md5 = md5.hexdigest().upper()
+	if fingerprint:
+		_md5_cache[fingerprint] = rom_md5
+	return rom_md5
+
 def add_n64_custom_info(game: 'ROMGame') -> None:
-	entire_rom = cast(FileROM, game.rom).read()
+	rom = cast(FileROM, game.rom)
+	header = rom.read(amount=64)
 
-	magic = entire_rom[:4]
+	magic = header[:4]
 
 	is_byteswapped = False
 	if magic == b'\x80\x37\x12\x40':
@@ -141,7 +188,6 @@ def add_n64_custom_info(game: 'ROMGame') -> None:
 		game.info.specific_info['ROM Format'] = 'Unknown'
 		return
 
-	header = entire_rom[:64]
 	if is_byteswapped:
 		header = byteswap(header)
 
@@ -156,8 +202,11 @@ def add_n64_custom_info(game: 'ROMGame') -> None:
 
 	database = _get_mupen64plus_database()
 	if database:
-		rom_md5 = hashlib.md5(entire_rom).hexdigest().upper()
-		database_entry = database.get(rom_md5)
+		rom_md5 = _get_z64_md5(rom, is_byteswapped=is_byteswapped)
+		database_entry = database.by_md5.get(rom_md5)
+		if not database_entry:
+			#Might be a hack or a bad dump or something, but the header checksums will probably still be the same
+			database_entry = database.by_crc.get(f'{header[16:20].hex().upper()} {header[20:24].hex().upper()}')
 		if database_entry:
 			_add_info_from_database_entry(game.info, database_entry)
 
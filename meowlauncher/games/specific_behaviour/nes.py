@@ -1,5 +1,5 @@
-from collections.abc import Collection
-from functools import lru_cache
+from collections.abc import Mapping, Sequence
+from functools import cache, lru_cache
 import zlib
 from typing import TYPE_CHECKING, cast
 
@@ -7,14 +7,14 @@ from meowlauncher import input_info
 from meowlauncher.common_types import SaveType
 from meowlauncher.games.mame_common.machine import (
 	Machine,
-	does_machine_match_name,
+	MachineNameIndex,
 	iter_machines_from_source_file,
 )
 from meowlauncher.games.mame_common.mame import MAME
 from meowlauncher.games.mame_common.software_list import (
 	Software,
+	SoftwareList,
 	SoftwarePart,
-	find_in_software_lists_with_custom_matcher,
 )
 from meowlauncher.games.roms.rom import FileROM
 from meowlauncher.info import Date, GameInfo
@@ -401,42 +401,47 @@ def add_ines_metadata(rom: FileROM, game_info: GameInfo, header: bytes) -> None:
 		# TV type apparently isn't used much despite it being part of the iNES specification, and looking at a lot of headered ROMs it does seem that they are all NTSC other than a few that say PAL that shouldn't be, so yeah, I wouldn't rely on it. Might as well just use the filename.
 
 
-def _does_nes_rom_match(part: 'SoftwarePart', prg_crc: int, chr_crc: int) -> bool:
+def _get_nes_part_crcs(part: 'SoftwarePart') -> tuple[int, int | None] | None:
+	"""Returns (PRG CRC32, CHR CRC32 or None if there is no CHR) that a headered ROM would need to have to be this part, or None if nothing could match it"""
 	prg_area = part.data_areas.get('prg')
 	# These two data area names seem to be used for alternate types of carts (Aladdin Deck Enhancer/Datach/etc)
 	if not prg_area:
 		prg_area = part.data_areas.get('rom')
 	if not prg_area:
 		prg_area = part.data_areas.get('cart')
+	if not prg_area:
+		return None
 
-	if prg_area:
-		# (There is only one ROM, or at least I hope so, otherwise I'd look silly)
-		try:
-			prg_matches = next(iter(prg_area.roms)).matches(prg_crc, None)
-		except StopIteration:
-			return False
-	else:
-		prg_matches = False  # prg_crc is None?
-
-	if not prg_matches:
-		return False
+	# (There is only one ROM, or at least I hope so, otherwise I'd look silly)
+	prg_rom = next(iter(prg_area.roms), None)
+	if not prg_rom or not prg_rom.crc32:
+		return None
 
 	chr_area = part.data_areas.get('chr')
-	if len(part.data_areas) == 2 and prg_area and not chr_area:
+	if len(part.data_areas) == 2 and not chr_area:
 		# This doesn't happen often, but... hmm
 		chr_area = part.data_areas.get('rom')
 
-	if chr_area:
-		try:
-			chr_matches = next(iter(chr_area.roms)).matches(chr_crc, None)
-		except StopIteration:
-			chr_matches = False
-	else:
-		chr_matches = chr_crc is None
-	if not chr_matches:
-		return False
+	if not chr_area:
+		return prg_rom.crc32, None
+	chr_rom = next(iter(chr_area.roms), None)
+	if not chr_rom or not chr_rom.crc32:
+		return None
+	return prg_rom.crc32, chr_rom.crc32
+
 
-	return True
+@cache
+def _get_nes_crc_index(
+	software_list: SoftwareList,
+) -> Mapping[tuple[int, int | None], Sequence[SoftwarePart]]:
+	"""{(PRG CRC32, CHR CRC32): parts}, so we don't have to go through every part in the software list for every headered ROM"""
+	index: dict[tuple[int, int | None], list[SoftwarePart]] = {}
+	for software in software_list.software.values():
+		for part in software.parts.values():
+			crcs = _get_nes_part_crcs(part)
+			if crcs:
+				index.setdefault(crcs, []).append(part)
+	return index
 
 
 def _get_headered_nes_rom_software_list_entry(game: 'ROMGame') -> 'Software | None':
@@ -456,9 +461,11 @@ def _get_headered_nes_rom_software_list_entry(game: 'ROMGame') -> 'Software | No
 		prg_crc32 = zlib.crc32(prg_rom)
 		chr_crc32 = zlib.crc32(chr_rom) if chr_rom else None
 
-	return find_in_software_lists_with_custom_matcher(
-		game.related_software_lists, _does_nes_rom_match, [prg_crc32, chr_crc32]
-	)
+	for software_list in game.related_software_lists:
+		parts = _get_nes_crc_index(software_list).get((prg_crc32, chr_crc32))
+		if parts:
+			return parts[0].software
+	return None
 
 
 def parse_unif_chunk(game_info: GameInfo, chunk_type: bytes, chunk_data: bytes) -> None:
@@ -523,31 +530,25 @@ def add_unif_metadata(rom: FileROM, game_info: GameInfo) -> None:
 
 
 @lru_cache(1)
-def _get_playchoice_10() -> Collection[Machine]:
+def _get_playchoice_10() -> MachineNameIndex:
 	mame = MAME()
 	if not mame.is_available:
-		return []
-	return frozenset(iter_machines_from_source_file('playch10', mame))
+		return MachineNameIndex(())
+	return MachineNameIndex(iter_machines_from_source_file('playch10', mame))
 
 
 @lru_cache(1)
-def _get_vs_system() -> Collection[Machine]:
+def _get_vs_system() -> MachineNameIndex:
 	mame = MAME()
 	if not mame.is_available:
-		return []
-	return frozenset(iter_machines_from_source_file('vsnes', mame))
+		return MachineNameIndex(())
+	return MachineNameIndex(iter_machines_from_source_file('vsnes', mame))
 
 
 def find_equivalent_nes_arcade(name: str) -> Machine | None:
-	for playchoice10_machine in _get_playchoice_10():
-		if does_machine_match_name(name, playchoice10_machine):
-			return playchoice10_machine
-
-	for vsnes_machine in _get_vs_system():
-		if does_machine_match_name(name, vsnes_machine, match_vs_system=True):
-			return vsnes_machine
-
-	return None
+	return _get_playchoice_10().find_machine(name) or _get_vs_system().find_machine(
+		name, match_vs_system=True
+	)
 
 
 def add_nes_software_list_metadata(software: 'Software', game_info: GameInfo) -> None:
@@ -3,14 +3,16 @@ import logging
 from dataclasses import dataclass
 from enum import IntEnum
 from functools import lru_cache
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from xml.etree import ElementTree
 
 from meowlauncher.games.common.generic_info import add_generic_software_info
+from meowlauncher.util.persistent_cache import get_file_fingerprint, load_or_create_cached
 from meowlauncher.util.region_info import get_language_by_english_name
 
 if TYPE_CHECKING:
-	from collections.abc import Collection, Mapping
+	from collections.abc import Mapping
 
 	from meowlauncher.games.roms.rom_game import ROMGame
 	from meowlauncher.info import GameInfo
@@ -38,57 +40,94 @@ class DuckStationCompatibilityEntry:
 	upscaling_issues: str | None
 
 
+def _parse_duckstation_compat_xml(
+	compat_xml_path: Path,
+) -> 'Mapping[str, DuckStationCompatibilityEntry | None]':
+	index: dict[str, DuckStationCompatibilityEntry | None] = {}
+	for entry in ElementTree.parse(compat_xml_path).iterfind('entry'):
+		code = entry.attrib.get('code')
+		if not code or code in index:
+			continue
+		index[code] = None
+		try:
+			compatibility = entry.attrib.get('compatibility')
+			if compatibility:
+				index[code] = DuckStationCompatibilityEntry(
+					DuckStationCompatibility(int(compatibility)),
+					entry.findtext('comments'),
+					entry.findtext('upscaling-issues'),
+				)
+		except ValueError:
+			pass
+	return index
+
+
 @lru_cache(maxsize=1)
-def _get_duckstation_compat_xml() -> 'ElementTree.ElementTree | None':
+def _get_duckstation_compat_index() -> 'Mapping[str, DuckStationCompatibilityEntry | None]':
+	"""{product code: compatibility entry} from compatibility.xml, kept in the cache directory until it is modified"""
 	assert _duckstation_config, 'We already checked before calling'
 	compat_xml_path = _duckstation_config.options.get('compatibility_xml_path')
 	if not compat_xml_path:
-		return None
+		return {}
 
 	try:
-		return ElementTree.parse(compat_xml_path)
+		return load_or_create_cached(
+			'duckstation_compatibility',
+			get_file_fingerprint(compat_xml_path),
+			lambda: _parse_duckstation_compat_xml(compat_xml_path),
+		)
 	except OSError:
 		logger.exception('oh dear')
-		return None
+		return {}
 
 
 def _find_duckstation_compat_info(product_code: str) -> DuckStationCompatibilityEntry | None:
-	compat_xml = _get_duckstation_compat_xml()
-	if not compat_xml:
-		return None
-	entry = compat_xml.find(f'entry[@code="{product_code}"]')
-	if entry is not None:
-		try:
-			compatibility = entry.attrib.get('compatibility')
-			if compatibility:
-				return DuckStationCompatibilityEntry(
-					DuckStationCompatibility(int(compatibility)),
-					entry.findtext('comments'),
-					entry.findtext('upscaling-issues'),
-				)
-		except ValueError:
-			pass
-	return None
+	return _get_duckstation_compat_index().get(product_code)
+
+
+_used_duckstation_db_keys = {
+	'name',
+	'languages',
+	'publisher',
+	'developer',
+	'releaseDate',
+	'vibration',
+	'multitap',
+	'linkCable',
+	'controllers',
+}
+"""Only keep what _add_duckstation_db_info uses when caching gamedb.json, so the cache stays smaller than the file"""
+
+
+def _parse_duckstation_db(gamedb_path: Path) -> 'Mapping[str, Mapping[str, Any]]':
+	index: dict[str, Mapping[str, Any]] = {}
+	for db_entry in json.loads(gamedb_path.read_bytes()):
+		serial = db_entry.get('serial')
+		if serial and serial not in index:
+			index[serial] = {k: v for k, v in db_entry.items() if k in _used_duckstation_db_keys}
+	return index
 
 
 @lru_cache(maxsize=1)
-def _get_duckstation_db() -> 'Collection[Mapping[Any, Any]]':
+def _get_duckstation_db() -> 'Mapping[str, Mapping[str, Any]]':
+	"""{serial: entry} from gamedb.json, kept in the cache directory until it is modified"""
 	assert _duckstation_config, 'We already checked before calling'
 	gamedb_path = _duckstation_config.options.get('gamedb_path')
 	if not gamedb_path:
-		return []
+		return {}
 	try:
-		return json.loads(gamedb_path.read_bytes())
+		return load_or_create_cached(
+			'duckstation_gamedb',
+			get_file_fingerprint(gamedb_path),
+			lambda: _parse_duckstation_db(gamedb_path),
+		)
 	except OSError:
 		logger.exception('oh bother')
-		return []
+		return {}
 
 
 def _get_duckstation_db_info(product_code: str) -> 'Mapping[Any, Any] | None':
-	return next(
-		(db_entry for db_entry in _get_duckstation_db() if db_entry.get('serial') == product_code),
-		None,
-	)
+	return _get_duckstation_db().get(product_code)
 
 
 def _add_duckstation_db_info(db_entry: 'Mapping[Any, Any]', metadata: 'GameInfo') -> None:
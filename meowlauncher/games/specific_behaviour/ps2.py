@@ -1,19 +1,10 @@
+import contextlib
 import logging
 import re
-import struct  # To handle struct.error
 from typing import TYPE_CHECKING, Any
 
-try:
-	from pycdlib import PyCdlib
-	from pycdlib.pycdlibexception import PyCdlibInvalidInput, PyCdlibInvalidISO
-
-	have_pycdlib = True
-except ModuleNotFoundError:
-	have_pycdlib = False
-
-import contextlib
-
 from meowlauncher.info import Date, GameInfo
+from meowlauncher.util.iso9660 import ISO9660Error, ISO9660Image
 from meowlauncher.util.region_info import TVSystem
 
 from .common.playstation_common import parse_product_code
@@ -52,23 +43,22 @@ def add_info_from_system_cnf(game_info: GameInfo, system_cnf: str) -> None:
 						game_info.specific_info['TV Type'] = TVSystem[value]
 
 
-def add_info_from_iso(iso: 'PyCdlib', metadata: 'GameInfo', object_for_warning: Any) -> None:
+def add_info_from_iso(iso: ISO9660Image, metadata: 'GameInfo', object_for_warning: Any) -> None:
 	try:
-		# I dunno what the ;1 is for
-		with iso.open_file_from_iso(iso_path='/SYSTEM.CNF;1') as system_cnf_file:
-			system_cnf = system_cnf_file.read().decode('utf-8', errors='backslashreplace')
+		# The ;1 is the file version, which is a thing in ISO 9660 that nobody uses
+		system_cnf = iso.read_file('/SYSTEM.CNF;1').decode('utf-8', errors='backslashreplace')
 		add_info_from_system_cnf(metadata, system_cnf)
-		date_record = iso.get_record(iso_path='/SYSTEM.CNF;1').date
+		date_record = iso.get_record('/SYSTEM.CNF;1')
 		# This would be more like a build date (seems to be the same across all files) rather than the release date, but it seems to be close enough
-		year = date_record.years_since_1900 + 1900
+		year = date_record.year
 		month = date_record.month
-		day = date_record.day_of_month
+		day = date_record.day
 		build_date = Date(year, month, day)
 		metadata.specific_info['Build Date'] = build_date
 		guessed_date = Date(year, month, day, is_guessed=True)
 		if guessed_date.is_better_than(metadata.release_date):
 			metadata.release_date = guessed_date
-	except PyCdlibInvalidInput:
+	except (FileNotFoundError, IsADirectoryError):
 		logger.info('%s has no SYSTEM.CNF inside', object_for_warning)
 	# Modules are in IOP, MODULES or IRX but I don't know if we can get any interesting info from that
 	# TODO: Sometimes there is a system.ini that looks like this:
@@ -82,17 +72,13 @@ def add_info_from_iso(iso: 'PyCdlib', metadata: 'GameInfo', object_for_warning:
 
 
 def add_ps2_custom_info(game: 'ROMGame') -> None:
-	# .bin/cue also has this system.cnf but I'd need to know how to get pycdlib to work with that
-	if game.rom.extension == 'iso' and have_pycdlib:
-		with game.rom.path.open('rb') as iso_file:
-			try:
-				iso = PyCdlib()
-				iso.open_fp(iso_file)
+	# .bin/cue also has this system.cnf but ISO9660Image would need to know how to skip over the sector headers for that
+	if game.rom.extension == 'iso':
+		try:
+			with ISO9660Image(game.rom.path) as iso:
 				add_info_from_iso(iso, game.info, game.rom)
-			except PyCdlibInvalidISO:
-				logger.info('%s is invalid ISO', game.rom, exc_info=True)
-			except struct.error:
-				logger.info('%s is invalid ISO and has some struct.error', game.rom)
+		except ISO9660Error:
+			logger.info('%s is invalid ISO', game.rom, exc_info=True)
 	# .elf is just a standard ordinary whole entire .elf
 	if game.info.product_code:
 		parse_product_code(game.info, game.info.product_code)
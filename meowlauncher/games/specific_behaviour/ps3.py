@@ -1,6 +1,5 @@
 import json
 import logging
-import os
 from collections.abc import Mapping
 from enum import Enum
 from functools import cache, lru_cache
@@ -11,6 +10,7 @@ from xml.etree import ElementTree
 from meowlauncher.games.common.engine_detect import try_and_detect_engine_from_folder
 from meowlauncher.games.roms.rom import FolderROM
 from meowlauncher.settings.platform_config import platform_configs
+from meowlauncher.util.persistent_cache import get_file_fingerprint, load_or_create_cached
 
 from .common.gametdb import TDB, add_info_from_tdb
 from .common.playstation_common import parse_param_sfo, parse_product_code
@@ -23,6 +23,7 @@ logger = logging.getLogger(__name__)
 
 @cache
 def _load_tdb() -> TDB | None:
+	"""Parsed once and then kept in the cache directory until the TDB file is modified"""
 	if 'PS3' not in platform_configs:
 		return None
 
@@ -31,13 +32,26 @@ def _load_tdb() -> TDB | None:
 		return None
 
 	try:
-		return TDB(ElementTree.parse(tdb_path))
+		return load_or_create_cached('ps3_gametdb', get_file_fingerprint(tdb_path), lambda: TDB(ElementTree.parse(tdb_path)))
 	except (ElementTree.ParseError, OSError):
 		logger.exception('Oh no failed to load PS3 TDB')
 		return None
 
 rpcs3_vfs_config_path = Path('~/.config/rpcs3/vfs.yml').expanduser()
 
+@cache
+def _get_rpcs3_hdd_path() -> Path:
+	rpcs3_hdd_path = Path('~/.config/rpcs3/dev_hdd0/').expanduser()
+	try:
+		if rpcs3_vfs_config_path.is_file():
+			for line in rpcs3_vfs_config_path.read_text(encoding='utf-8').splitlines():
+				if line.startswith('/dev_hdd0/: '):
+					rpcs3_hdd_path = Path(line.rstrip().split(': ', 1)[1])
+					break
+	except OSError:
+		pass
+	return rpcs3_hdd_path
+
 def add_game_folder_info(rom: FolderROM, game_info: 'GameInfo') -> None:
 	param_sfo_path = rom.relevant_files['PARAM.SFO']
 	usrdir = rom.relevant_files['USRDIR']
@@ -73,17 +87,7 @@ def add_game_folder_info(rom: FolderROM, game_info: 'GameInfo') -> None:
 
 	parse_param_sfo(rom.path, game_info, param_sfo_path.read_bytes())
 
-	rpcs3_hdd_path = Path('~/.config/rpcs3/dev_hdd0/').expanduser()
-	try:
-		if rpcs3_vfs_config_path.is_file():
-			for line in rpcs3_vfs_config_path.read_text(encoding='utf-8').splitlines():
-				if line.startswith('/dev_hdd0/: '):
-					rpcs3_hdd_path = Path(line.rstrip().split(': ', 1)[1])
-					break
-	except OSError:
-		pass
-
-	is_installed_to_rpcs3_hdd = rom.path.parent == rpcs3_hdd_path.joinpath('game')
+	is_installed_to_rpcs3_hdd = rom.path.parent == _get_rpcs3_hdd_path().joinpath('game')
 	#Messy hack time
 	if is_installed_to_rpcs3_hdd and game_info.names:
 		#If we found a banner title, etc then use that instead
@@ -101,24 +105,43 @@ class RPCS3Compatibility(Enum):
 	Playable = 4
 	#There is no perfect? Not yet comfy saying anything is I guess
 
+_rpcs3_compat_db_path = Path('~/.config/rpcs3/GuiConfigs/compat_database.dat').expanduser()
+
+def _parse_rpcs3_compatibility_db() -> Mapping[str, RPCS3Compatibility]:
+	results: Mapping[str, Mapping[str, Any]] = json.loads(_rpcs3_compat_db_path.read_bytes()).get('results', {})
+	compat = {}
+	for product_code, game in results.items():
+		try:
+			compat[product_code] = RPCS3Compatibility[game.get('status', 'Unknown')]
+		except KeyError:
+			pass
+	return compat
+
 @lru_cache(maxsize=1)
-def _get_rpcs3_compatibility_db() -> Mapping[str, Any]:
-	compat_db_path = Path('~/.config/rpcs3/GuiConfigs/compat_database.dat').expanduser()
-	return json.loads(compat_db_path.read_bytes())
+def _get_rpcs3_compatibility_db() -> Mapping[str, RPCS3Compatibility]:
+	"""{serial: compatibility}, only keeping the status as that's all we use, so the whole JSON file doesn't need to be decoded every time; kept in the cache directory until RPCS3 downloads a new one"""
+	try:
+		return load_or_create_cached('rpcs3_compatibility', get_file_fingerprint(_rpcs3_compat_db_path), _parse_rpcs3_compatibility_db)
+	except FileNotFoundError:
+		return {}
 
 def _get_rpcs3_compat(product_code: str) -> RPCS3Compatibility | None:
 	"""Looks up this serial in RPCS3's compatibility database, if it is there in the config folder (needs to be downloaded from within RPCS3)"""
+	return _get_rpcs3_compatibility_db().get(product_code)
+
+@cache
+def _get_covers(covers_path: Path) -> Mapping[str, Path]:
+	"""{product code: cover} for all the covers in covers_path, so we only list it once instead of looking for a few files for every game"""
+	covers: dict[str, Path] = {}
 	try:
-		game = _get_rpcs3_compatibility_db()['results'][product_code]
-		status = game.get('status', 'Unknown')
-		
-		try:
-			return RPCS3Compatibility[status]
-		except KeyError:
-			pass
-	except KeyError:
+		for cover_path in covers_path.iterdir():
+			#Prefer png over jpg if there's both
+			ext = cover_path.suffix[1:]
+			if ext == 'png' or (ext == 'jpg' and cover_path.stem not in covers):
+				covers[cover_path.stem] = cover_path
+	except OSError:
 		pass
-	return None
+	return covers
 	
 def add_cover(game_info: 'GameInfo', product_code: str) -> None:
 	"""Intended for the covers database from GameTDB"""
@@ -128,12 +151,9 @@ def add_cover(game_info: 'GameInfo', product_code: str) -> None:
 		return
 	if not covers_path:
 		return
-	cover_path = covers_path.joinpath(product_code)
-	for ext in ('png', 'jpg'):
-		potential_cover_path = cover_path.with_suffix(os.extsep + ext)
-		if potential_cover_path.is_file():
-			game_info.images['Cover'] = potential_cover_path
-			break
+	cover_path = _get_covers(covers_path).get(product_code)
+	if cover_path:
+		game_info.images['Cover'] = cover_path
 
 def add_ps3_custom_info(game: 'ROMGame') -> None:
 	if game.rom.is_folder:
@@ -1,7 +1,6 @@
 import io
 import logging
 from pathlib import Path
-import struct  # To handle struct.error
 from typing import TYPE_CHECKING, Any, cast
 
 try:
@@ -10,17 +9,9 @@ try:
 except ModuleNotFoundError:
 	have_pillow = False
 
-try:
-
-	from pycdlib import PyCdlib
-	from pycdlib.dr import DirectoryRecord
-	from pycdlib.pycdlibexception import PyCdlibInvalidInput, PyCdlibInvalidISO
-	have_pycdlib = True
-except ModuleNotFoundError:
-	have_pycdlib = False
-
 from meowlauncher.games.roms.rom import FileROM, FolderROM
 from meowlauncher.info import Date
+from meowlauncher.util.iso9660 import ISO9660Error, ISO9660Image
 
 from .common.playstation_common import parse_param_sfo, parse_product_code
 from .static_platform_info import add_psp_info
@@ -77,48 +68,44 @@ def _add_info_from_pbp(rompath_just_for_warning: Any, game_info: 'GameInfo', pbp
 			if pic1:
 				game_info.images['Background Image'] = pic1
 
-def _get_image_from_iso(iso: 'PyCdlib', inner_path: str, object_for_warning: Any=None) -> 'Image.Image | None':
+def _get_image_from_iso(iso: ISO9660Image, inner_path: str, object_for_warning: Any=None) -> 'Image.Image | None':
 	try:
-		with iso.open_file_from_iso(iso_path=inner_path) as image_data:
-			try:
-				image = Image.open(image_data)
-				image.load() #Force Pillow to figure out if the image is valid or not, and also copy the image data
-			except (OSError, SyntaxError):
-				logger.info('Error getting image %s inside ISO %s', inner_path, object_for_warning or iso)
-				return None
-			else:
-				return image
-	except PyCdlibInvalidInput:
+		image_data = iso.read_file(inner_path)
+	except (FileNotFoundError, IsADirectoryError):
 		#It is okay for a disc to be missing something
-		pass
-	return None
+		return None
+	try:
+		image = Image.open(io.BytesIO(image_data))
+		image.load() #Force Pillow to figure out if the image is valid or not
+	except (OSError, SyntaxError):
+		logger.info('Error getting image %s inside ISO %s', inner_path, object_for_warning or iso.path)
+		return None
+	else:
+		return image
 
 def _add_psp_iso_info(path: Path, game_info: 'GameInfo') -> None:
-	with path.open('rb') as iso_file:
-		try:
-			iso = PyCdlib()
-			iso.open_fp(iso_file)
+	try:
+		with ISO9660Image(path) as iso:
 			try:
-				with iso.open_file_from_iso(iso_path='/PSP_GAME/PARAM.SFO') as param_sfo:
-					parse_param_sfo(path, game_info, param_sfo.read())
+				parse_param_sfo(path, game_info, iso.read_file('/PSP_GAME/PARAM.SFO'))
 
-				date = cast(DirectoryRecord, iso.get_record(iso_path='/PSP_GAME/PARAM.SFO')).date
+				date = iso.get_record('/PSP_GAME/PARAM.SFO')
 				#This would be more like a build date (seems to be the same across all files) rather than the release date
-				year = date.years_since_1900 + 1900
+				year = date.year
 				month = date.month
-				day = date.day_of_month
+				day = date.day
 				game_info.specific_info['Build Date'] = Date(year, month, day)
 				guessed = Date(year, month, day, True)
 				if guessed.is_better_than(game_info.release_date):
 					game_info.release_date = guessed
-			except PyCdlibInvalidInput:
+			except (FileNotFoundError, IsADirectoryError):
 				try:
-					iso.get_record(iso_path='/UMD_VIDEO/PARAM.SFO')
+					iso.get_record('/UMD_VIDEO/PARAM.SFO')
 					#We could parse this PARAM.SFO but there's not much point given we aren't going to make a launcher for UMD videos at this stage
 					#TODO There is also potentially /UMD_AUDIO/ I think too so I should rewrite this one day
 					game_info.specific_info['PlayStation Category'] = 'UMD Video'
 					return
-				except PyCdlibInvalidInput:
+				except FileNotFoundError:
 					logger.info('%s has no PARAM.SFO inside', path)
 			else:
 				if have_pillow:
@@ -129,10 +116,8 @@ def _add_psp_iso_info(path: Path, game_info: 'GameInfo') -> None:
 						('Background Image', _get_image_from_iso(iso, '/PSP_GAME/PIC1.PNG', path)),
 					) if v
 					))
-		except PyCdlibInvalidISO:
-			logger.info('%s is invalid ISO and has some struct.error', path, exc_info=True)
-		except struct.error:
-			logger.info('%s is invalid ISO and has some struct.error', path)
+	except ISO9660Error:
+		logger.info('%s is invalid ISO', path, exc_info=True)
 		
 def add_psp_custom_info(game: 'ROMGame') -> None:
 	"""Called from info_helpers for now"""
@@ -150,7 +135,7 @@ def add_psp_custom_info(game: 'ROMGame') -> None:
 		if game.rom.name.lower() == 'eboot':
 			game.info.add_alternate_name(game.rom.path.parent.name, 'Folder Name')
 			game.rom.ignore_name = True
-	elif game.rom.extension == 'iso' and have_pycdlib:
+	elif game.rom.extension == 'iso':
 		_add_psp_iso_info(game.rom.path, game.info)
 
 	#https://www.psdevwiki.com/ps3/Productcode#Physical
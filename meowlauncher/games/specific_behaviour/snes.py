@@ -1,15 +1,10 @@
 import calendar
 from dataclasses import dataclass
 from functools import lru_cache
-from itertools import chain
 from typing import TYPE_CHECKING, Any
 
 from meowlauncher.common_types import SaveType
-from meowlauncher.games.mame_common.machine import (
-	Machine,
-	does_machine_match_name,
-	iter_machines_from_source_file,
-)
+from meowlauncher.games.mame_common.machine import Machine, MachineNameIndex
 from meowlauncher.games.mame_common.mame import MAME
 from meowlauncher.platform_types import SNESExpansionChip
 from meowlauncher.util.region_info import regions_by_name
@@ -341,39 +336,29 @@ def _add_satellaview_metadata(rom: 'FileROM', metadata: 'GameInfo') -> None:
 
 
 @lru_cache(1)
-def _get_nss_machines():
+def _get_snes_arcade_name_index() -> MachineNameIndex:
+	"""Nintendo Super System, and bootleg arcade boards running SNES games"""
 	mame = MAME()
 	if not mame.is_available:
-		return []
-	return frozenset(iter_machines_from_source_file('nss', mame))
-
-
-@lru_cache(1)
-def _get_snes_arcade_bootlegs():
-	mame = MAME()
-	if not mame.is_available:
-		return []
-	return (
-		*iter_machines_from_source_file('snesb', mame),
-		*iter_machines_from_source_file('snesb51', mame),
+		return MachineNameIndex(())
+	return MachineNameIndex.for_source_files(
+		'snes_arcade_name_index', ('nss', 'snesb', 'snesb51'), mame
 	)
 
 
 def find_equivalent_snes_arcade(name: str) -> Machine | None:
-	for machine in chain(_get_nss_machines(), _get_snes_arcade_bootlegs()):
-		if does_machine_match_name(name, machine):
-			return machine
-
-	return None
+	return _get_snes_arcade_name_index().find_machine(name)
 
 
 def add_snes_rom_header_info(rom: 'FileROM', metadata: 'GameInfo') -> None:
-	if rom.extension in {'sfc', 'smc', 'swc'}:
-		_add_normal_snes_header(rom, metadata)
-	elif rom.extension == 'bs':
-		_add_satellaview_metadata(rom, metadata)
-	elif rom.extension == 'st':
-		_parse_sufami_turbo_header(rom, metadata)
+	# Covers the LoROM and HiROM header locations with or without a copier header, ExHiROM is far enough in that it's not worth it
+	with rom.buffer_windows(0x10200):
+		if rom.extension in {'sfc', 'smc', 'swc'}:
+			_add_normal_snes_header(rom, metadata)
+		elif rom.extension == 'bs':
+			_add_satellaview_metadata(rom, metadata)
+		elif rom.extension == 'st':
+			_parse_sufami_turbo_header(rom, metadata)
 
 
 def add_snes_software_list_metadata(software: 'Software', metadata: 'GameInfo') -> None:
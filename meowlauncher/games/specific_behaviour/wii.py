@@ -1,6 +1,9 @@
 import logging
+import zlib
+from collections.abc import Mapping
 from datetime import datetime
 from enum import Enum
+from functools import cached_property, lru_cache
 from typing import TYPE_CHECKING, cast
 from xml.etree import ElementTree
 
@@ -17,6 +20,11 @@ from meowlauncher.games.roms.rom import FileROM, FolderROM
 from meowlauncher.info import Date
 from meowlauncher.platform_types import WiiTitleType
 from meowlauncher.settings.platform_config import platform_configs
+from meowlauncher.util.persistent_cache import (
+	FileFingerprint,
+	PersistentLRUCache,
+	get_file_fingerprint,
+)
 from meowlauncher.util.utils import NotAlphanumericError, convert_alphanumeric, load_dict
 
 from .common.gamecube_wii_common import (
@@ -37,6 +45,12 @@ logger = logging.getLogger(__name__)
 _nintendo_licensee_codes = load_dict(None, 'nintendo_licensee_codes')
 
 _wii_config = platform_configs.get('Wii')
+_common_key: str | None = _wii_config.options.get('common_key') if _wii_config else None
+
+_game_partition_cache: PersistentLRUCache[FileFingerprint, tuple[bytes, bytes | None]] = PersistentLRUCache(
+	'wii_game_partitions', 10_000, version=zlib.crc32(_common_key.encode()) if _common_key else None
+)
+"""{disc fingerprint: (apploader date, start of opening.bnr)}, so we don't have to decrypt anything again for discs we have seen before; the version changes with the common key so anything decrypted with the wrong one doesn't stick around"""
 
 
 class WiiVirtualConsolePlatform(Enum):
@@ -118,8 +132,8 @@ def _parse_tmd(metadata: 'GameInfo', tmd: bytes) -> None:
 
 def _parse_opening_bnr(metadata: 'GameInfo', opening_bnr: bytes) -> None:
 	"""We will not try and bother parsing banner.bin or icon.bin, that would take a lot of effort"""
-	imet = opening_bnr[64:]
-	# I don't know why this is 64 bytes in, aaaa
+	# I don't know why this is 64 bytes in for WADs, aaaa (but not for opening.bnr on discs)
+	imet = opening_bnr[64:] if opening_bnr[128:132] == b'IMET' else opening_bnr
 
 	# Padding: 0-64
 	magic = imet[64:68]
@@ -271,6 +285,115 @@ def add_wii_homebrew_metadata(rom: FolderROM, game_info: 'GameInfo') -> None:
 			logger.info('Ah bugger Wii homebrew XML in %s has problems', rom, exc_info=True)
 
 
+_cluster_size = 0x8000
+_cluster_data_size = 0x7C00
+"""Each cluster has 0x400 bytes of hashes before the actual data"""
+
+
+class WiiPartitionError(Exception):
+	"""Partition data does not make sense, probably because the common key is wrong or the disc is not a plain ISO"""
+
+
+@lru_cache
+def _decrypt_title_key(common_key: bytes, encrypted_title_key: bytes, title_id: bytes) -> bytes:
+	aes = AES.new(common_key, AES.MODE_CBC, title_id + (b'\x00' * 8))
+	return aes.decrypt(encrypted_title_key)
+
+
+class _WiiPartition:
+	"""Decrypted view of the data inside a partition of a Wii disc
+	Clusters are only read and decrypted the first time something inside them is read, and then kept around, so reading the filesystem only touches the few clusters it needs"""
+
+	def __init__(self, rom: FileROM, partition_offset: int, common_key: bytes) -> None:
+		self.rom = rom
+		header = rom.read(partition_offset, 0x2C0)
+		if len(header) < 0x2C0:
+			raise WiiPartitionError(f'Partition at {partition_offset:#x} is past the end of {rom}')
+		self.title_key = _decrypt_title_key(common_key, header[0x1BF:0x1CF], header[0x1DC:0x1E4])
+		self.data_offset = partition_offset + (int.from_bytes(header[0x2B8:0x2BC], 'big') << 2)
+		self.data_size = (int.from_bytes(header[0x2BC:0x2C0], 'big') << 2) // _cluster_size * _cluster_data_size
+		"""Size of the decrypted data"""
+		self._clusters: dict[int, bytes] = {}
+
+	def _get_cluster(self, index: int) -> bytes:
+		cluster = self._clusters.get(index)
+		if cluster is None:
+			encrypted = self.rom.read(self.data_offset + (index * _cluster_size), _cluster_size)
+			if len(encrypted) < _cluster_size:
+				raise WiiPartitionError(f'Cluster {index} is past the end of {self.rom}')
+			aes = AES.new(self.title_key, AES.MODE_CBC, encrypted[0x3D0:0x3E0])
+			cluster = self._clusters[index] = aes.decrypt(encrypted[0x400:])
+		return cluster
+
+	def read(self, offset: int, amount: int) -> bytes:
+		if offset < 0 or offset + amount > self.data_size:
+			raise WiiPartitionError(f'Tried to read {amount:#x} bytes at {offset:#x} in partition of size {self.data_size:#x}')
+		parts = []
+		while amount > 0:
+			index, cluster_offset = divmod(offset, _cluster_data_size)
+			part = self._get_cluster(index)[cluster_offset : cluster_offset + amount]
+			parts.append(part)
+			offset += len(part)
+			amount -= len(part)
+		return b''.join(parts)
+
+	@cached_property
+	def root_files(self) -> Mapping[str, tuple[int, int]]:
+		"""{lowercase name: (offset, size)} for the files in the root directory of the FST"""
+		# DOL offset: 0x420-0x424
+		fst_location = self.read(0x424, 8)
+		fst = self.read(
+			int.from_bytes(fst_location[0:4], 'big') << 2, int.from_bytes(fst_location[4:8], 'big') << 2
+		)
+		# First entry is the root directory, its size is the number of entries
+		entry_count = int.from_bytes(fst[8:12], 'big')
+		if not fst or fst[0] != 1 or entry_count * 12 > len(fst):
+			raise WiiPartitionError(f'FST in {self.rom} is invalid')
+		string_table = fst[entry_count * 12 :]
+
+		files = {}
+		i = 1
+		while i < entry_count:
+			entry = fst[i * 12 : (i + 1) * 12]
+			if entry[0]:
+				# Directory, size is the index of the next entry after everything in it, so skip to that
+				i = max(int.from_bytes(entry[8:12], 'big'), i + 1)
+				continue
+			name_offset = int.from_bytes(entry[1:4], 'big')
+			name = string_table[name_offset : string_table.find(b'\0', name_offset)]
+			files[name.decode('ascii', 'backslashreplace').lower()] = (
+				int.from_bytes(entry[4:8], 'big') << 2,
+				int.from_bytes(entry[8:12], 'big'),
+			)
+			i += 1
+		return files
+
+	def read_root_file(self, name: str, amount: int = -1) -> bytes | None:
+		"""Reads a file in the root directory of this partition, or the first amount bytes of it, or returns None if it is not there"""
+		location = self.root_files.get(name.lower())
+		if not location:
+			return None
+		offset, size = location
+		return self.read(offset, size if amount == -1 else min(amount, size))
+
+
+def _read_game_partition(rom: FileROM, game_partition_offset: int, common_key: bytes) -> tuple[bytes, bytes | None]:
+	"""Returns the apploader date and the start of opening.bnr (which is all _parse_opening_bnr needs) from the game partition
+	:raises WiiPartitionError: If the partition can't be read"""
+	fingerprint = get_file_fingerprint(rom.path)
+	if fingerprint:
+		cached = _game_partition_cache.get(fingerprint)
+		if cached:
+			return cached
+
+	partition = _WiiPartition(rom, game_partition_offset, common_key)
+	apploader_date = partition.read(0x2440, 0x10)
+	opening_bnr = partition.read_root_file('opening.bnr', 0x400)
+	if fingerprint:
+		_game_partition_cache[fingerprint] = apploader_date, opening_bnr
+	return apploader_date, opening_bnr
+
+
 def _add_wii_disc_metadata(rom: FileROM, game_info: 'GameInfo') -> None:
 	wii_header = rom.read(0x40_000, 0xF000)
 
@@ -294,32 +417,17 @@ def _add_wii_disc_metadata(rom: FileROM, game_info: 'GameInfo') -> None:
 			elif partition_type == 0 and game_partition_offset is None:
 				game_partition_offset = partition_offset
 
-	common_key = None
-	if _wii_config:
-		common_key = _wii_config.options.get('common_key')
-	if common_key:
-		if game_partition_offset and have_pycrypto:
-			game_partition_header = rom.read(game_partition_offset, 0x2C0)
-			title_iv = game_partition_header[0x1DC:0x1E4] + (b'\x00' * 8)
-			data_offset = int.from_bytes(game_partition_header[0x2B8:0x2BC], 'big') << 2
-
-			master_key = bytes.fromhex(common_key)
-			aes = AES.new(master_key, AES.MODE_CBC, title_iv)
-			encrypted_key = game_partition_header[0x1BF:0x1CF]
-			key = aes.decrypt(encrypted_key)
-
-			chunk_offset = (
-				game_partition_offset + data_offset
-			)  # + (index * 0x8000) but we only need 1st chunk (0x7c00 bytes of encrypted data each chunk)
-			chunk = rom.read(chunk_offset, 0x8000)
-			chunk_iv = chunk[0x3D0:0x3E0]
-			aes = AES.new(key, AES.MODE_CBC, chunk_iv)
-			decrypted_chunk = aes.decrypt(chunk[0x400:])
-
-			# TODO: Try and read filesystem to see if there is an opening.bnr in there (should be)
-
+	opening_bnr = None
+	if _common_key and game_partition_offset and have_pycrypto:
+		try:
+			apploader_date_bytes, opening_bnr = _read_game_partition(
+				rom, game_partition_offset, bytes.fromhex(_common_key)
+			)
+		except (WiiPartitionError, ValueError):
+			logger.info('Could not read game partition of %s', rom, exc_info=True)
+		else:
 			try:
-				apploader_date = decrypted_chunk[0x2440:0x2450].rstrip(b'\0').decode('ascii')
+				apploader_date = apploader_date_bytes.rstrip(b'\0').decode('ascii')
 				try:
 					d = datetime.strptime(apploader_date, '%Y/%m/%d')
 					game_info.specific_info['Build Date'] = Date(d.year, d.month, d.day)
@@ -336,6 +444,9 @@ def _add_wii_disc_metadata(rom: FileROM, game_info: 'GameInfo') -> None:
 	with contextlib.suppress(ValueError):
 		game_info.specific_info['Region Code'] = NintendoDiscRegion(region_code)
 	add_ratings_info(game_info, WiiRatings(wii_header[0xE010:0xE020]))
+	if opening_bnr:
+		# After region code, as that decides which banner title is the main one
+		_parse_opening_bnr(game_info, opening_bnr)
 
 
 def add_wii_custom_info(game: 'ROMGame') -> None:
@@ -1,8 +1,14 @@
 import io
 import logging
+import mmap
+import os
 import re
+import struct
 import zipfile
-from collections.abc import Collection, Iterator, Mapping
+from collections import defaultdict
+from collections.abc import Collection, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from operator import attrgetter
 from pathlib import Path
 from typing import Any
@@ -17,11 +23,30 @@ except ModuleNotFoundError:
 	have_pillow = False
 
 from meowlauncher.config import main_config
+from meowlauncher.util.persistent_cache import PersistentLRUCache, get_file_fingerprint
 
 from .steam_types import StateFlags
 
 logger = logging.getLogger(__name__)
 
+_app_manifest_cache: PersistentLRUCache[tuple[str, int, int], Mapping[str, Any]] = PersistentLRUCache(
+	'steam_app_manifests', 20_000
+)
+"""Parsed appmanifest_*.acf files, keyed by file fingerprint so anything that has been updated since gets read again"""
+
+
+def _load_app_manifest(acf_file_path: Path) -> Mapping[str, Any]:
+	fingerprint = get_file_fingerprint(acf_file_path)
+	if fingerprint:
+		cached = _app_manifest_cache.get(fingerprint)
+		if cached is not None:
+			return cached
+	# Technically I could try and parse it without steamfiles, but that would be irresponsible, so I shouldn't do that
+	app_manifest = acf.loads(acf_file_path.read_text('utf-8'))
+	if fingerprint:
+		_app_manifest_cache[fingerprint] = app_manifest
+	return app_manifest
+
 
 class IconError(Exception):
 	pass
@@ -31,13 +56,68 @@ class IconNotFoundError(Exception):
 	pass
 
 
+class LazyAppInfo(Mapping[int, Mapping[str, Any]]):
+	"""appinfo.vdf, memory-mapped, with only the offset of each app's record read up front; each record is decoded (by steamfiles) the first time that appid is asked for
+	appinfo.vdf can be hundreds of megabytes with a large library, and we only want the installed apps out of it"""
+
+	_header_size = 8
+	"""Magic/version and universe, both uint32"""
+	_record_header = struct.Struct('<2I')
+	"""appid, size of the rest of the record after this"""
+
+	def __init__(self, path: Path) -> None:
+		""":raises ValueError: If steamfiles doesn't understand the format of this appinfo.vdf (or it is truncated)"""
+		with path.open('rb') as f:
+			self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+		self._header = self._mmap[: self._header_size]
+		self._offsets: dict[int, tuple[int, int]] = {}
+		self._decoded: dict[int, Mapping[str, Any]] = {}
+
+		offset = self._header_size
+		end = len(self._mmap)
+		while offset + self._record_header.size <= end:
+			appid, size = self._record_header.unpack_from(self._mmap, offset)
+			if appid == 0:
+				# End marker
+				break
+			record_size = self._record_header.size + size
+			if offset + record_size > end:
+				raise ValueError(f'appinfo.vdf record for {appid} goes past the end of the file')
+			self._offsets[appid] = (offset, record_size)
+			offset += record_size
+
+		# Make sure steamfiles can actually decode these records, so we find out now and not later
+		first_appid = next(iter(self._offsets), None)
+		if first_appid is not None:
+			self[first_appid]
+
+	def __getitem__(self, appid: int) -> Mapping[str, Any]:
+		decoded = self._decoded.get(appid)
+		if decoded is None:
+			start, size = self._offsets[appid]
+			# Give steamfiles an appinfo.vdf that only has this one app in it
+			one_app = self._header + self._mmap[start : start + size] + bytes(4)
+			decoded = self._decoded[appid] = appinfo.loads(one_app)[appid]
+		return decoded
+
+	def __iter__(self) -> Iterator[int]:
+		return iter(self._offsets)
+
+	def __len__(self) -> int:
+		return len(self._offsets)
+
+	def __contains__(self, appid: object) -> bool:
+		return appid in self._offsets
+
+
 class SteamInstallation:
 	"""Stores the parsed results of various Steam files in a given install directory"""
 
 	def __init__(self, path: Path):
 		self.steamdir = path
+		self.app_info: LazyAppInfo | None
 		try:
-			self.app_info = appinfo.loads(self.app_info_path.read_bytes())
+			self.app_info = LazyAppInfo(self.app_info_path)
 			self.app_info_available = True
 		except (FileNotFoundError, ValueError):
 			# ValueError will be thrown by steamfiles.appinfo if the appinfo.vdf structure is different than expected, which apparently has happened in earlier versions of it, so I should probably be prepared for that
@@ -189,10 +269,19 @@ class SteamInstallation:
 			compat_tool[0] for compat_tool in self.steamplay_compat_tools.values() if compat_tool[0]
 		}
 
-		for library_folder in self.iter_steam_library_folders():
-			for acf_file_path in library_folder.joinpath('steamapps').glob('*.acf'):
-				# Technically I could try and parse it without steamfiles, but that would be irresponsible, so I shouldn't do that
-				app_manifest = acf.loads(acf_file_path.read_text('utf-8'))
+		acf_file_paths = [
+			(library_folder, acf_file_path)
+			for library_folder in self.iter_steam_library_folders()
+			for acf_file_path in library_folder.joinpath('steamapps').glob('*.acf')
+		]
+		# Mostly waiting on reading the files, which could be on several different drives, so read them all at once
+		with ThreadPoolExecutor() as executor:
+			app_manifests = executor.map(
+				_load_app_manifest, (acf_file_path for _, acf_file_path in acf_file_paths)
+			)
+			for (library_folder, acf_file_path), app_manifest in zip(
+				acf_file_paths, app_manifests, strict=True
+			):
 				app_state = app_manifest.get('AppState')
 				if not app_state:
 					# Should only happen if .acf is junk (or format changes dramatically), there's no other keys than AppState
@@ -260,84 +349,113 @@ class SteamInstallation:
 
 				yield library_folder, appid, app_state
 
+	@cached_property
+	def _library_cache_images(self) -> Mapping[str, Mapping[str, Path]]:
+		"""Files in library_cache_folder, {stem: {extension without dot: path}}, so we only list the folder once and not stat a few files for every image for every game"""
+		images: defaultdict[str, dict[str, Path]] = defaultdict(dict)
+		try:
+			with os.scandir(self.library_cache_folder) as it:
+				for entry in it:
+					stem, _, ext = entry.name.rpartition('.')
+					if stem and entry.is_file():
+						images[stem][ext] = Path(entry.path)
+		except FileNotFoundError:
+			pass
+		return images
+
 	def find_image(self, appid: int, image_name: str) -> Path | None:
-		basename = self.library_cache_folder.joinpath(f'{appid}_{image_name}')
-		# Can be either png or jpg, I guess… could also listdir or glob I guess but ehhh brain broke lately
+		images = self._library_cache_images.get(f'{appid}_{image_name}')
+		if not images:
+			return None
+		# Can be either png or jpg, I guess
 		for ext in ('png', 'jpg', 'jpeg'):
-			path = basename.with_suffix('.' + ext)
-			if path.is_file():
+			path = images.get(ext)
+			if path:
 				return path
 		return None
 
+	@cached_property
+	def _icons_by_hash(self) -> Mapping[str, Sequence[Path]]:
+		"""Files in icon_folder that could be icons, {lowercase hash: paths}, so look_for_icon doesn't have to go through the whole folder for every game"""
+		icons: defaultdict[str, list[Path]] = defaultdict(list)
+		try:
+			with os.scandir(self.icon_folder) as it:
+				for entry in it:
+					path = Path(entry.path)
+					if path.suffix in {'.ico', '.png', '.zip'}:
+						icons[path.stem.lower()].append(path)
+		except FileNotFoundError:
+			pass
+		return icons
+
 	def look_for_icon(self, icon_hash: str) -> 'Image.Image | Path | None':
 		icon_hash = icon_hash.lower()
-		for icon_path in self.icon_folder.iterdir():
-			if icon_path.stem.lower() == icon_hash and icon_path.suffix in {'.ico', '.png', '.zip'}:
-				is_zip = zipfile.is_zipfile(icon_path)
-				# Can't just rely on the extension because some zip files like to hide and pretend to be .ico files for some reason
-
-				with icon_path.open('rb') as test:
-					magic = test.read(4)
-					if magic == b'Rar!':
-						raise IconError(
-							f'icon {icon_hash} is secretly a RAR file and cannot be opened'
-						)
+		for icon_path in self._icons_by_hash.get(icon_hash, ()):
+			is_zip = zipfile.is_zipfile(icon_path)
+			# Can't just rely on the extension because some zip files like to hide and pretend to be .ico files for some reason
+
+			with icon_path.open('rb') as test:
+				magic = test.read(4)
+				if magic == b'Rar!':
+					raise IconError(
+						f'icon {icon_hash} is secretly a RAR file and cannot be opened'
+					)
 
-				if icon_path.suffix == '.ico' and not is_zip:
-					if have_pillow:
-						# .ico files can be a bit flaky with Tumbler thumbnails and some other image-reading stuff, so if we can convert them, that might be a good idea just in case (well, there definitely are some icons that don't thumbnail properly so yeah)
+			if icon_path.suffix == '.ico' and not is_zip:
+				if have_pillow:
+					# .ico files can be a bit flaky with Tumbler thumbnails and some other image-reading stuff, so if we can convert them, that might be a good idea just in case (well, there definitely are some icons that don't thumbnail properly so yeah)
+					try:
+						image = Image.open(icon_path)
+					except (ValueError, OSError) as ex:
+						# Try and handle the "This is not one of the allowed sizes of this image" error caused by .ico files having incorrect headers which I guess happens more often than I would have thought otherwise
+						# This is gonna get ugly
 						try:
-							image = Image.open(icon_path)
-						except (ValueError, OSError) as ex:
-							# Try and handle the "This is not one of the allowed sizes of this image" error caused by .ico files having incorrect headers which I guess happens more often than I would have thought otherwise
-							# This is gonna get ugly
-							try:
-								# Use BytesIO here to prevent "seeking a closed file" errors, which is probably a sign that I don't actually know what I'm doing
-								ico = IcoImagePlugin.IcoFile(io.BytesIO(icon_path.read_bytes()))
-								biggest_size = (0, 0)
-								for size in ico.sizes():
-									if size[0] > biggest_size[0] and size[1] > biggest_size[1]:
-										biggest_size = size
-								if biggest_size == (0, 0):
-									raise IconError(
-										f'.ico file {icon_path} has no valid sizes'
-									) from ex
-								return ico.getimage(biggest_size)
-							except SyntaxError as syntax_error:
-								# Of all the errors it throws, it throws this one? Well, okay fine whatever
+							# Use BytesIO here to prevent "seeking a closed file" errors, which is probably a sign that I don't actually know what I'm doing
+							ico = IcoImagePlugin.IcoFile(io.BytesIO(icon_path.read_bytes()))
+							biggest_size = (0, 0)
+							for size in ico.sizes():
+								if size[0] > biggest_size[0] and size[1] > biggest_size[1]:
+									biggest_size = size
+							if biggest_size == (0, 0):
 								raise IconError(
-									f'.ico file {icon_path} is not actually an .ico file at all'
-								) from syntax_error
-						except Exception as ex:
-							# Guess it's still broken
+									f'.ico file {icon_path} has no valid sizes'
+								) from ex
+							return ico.getimage(biggest_size)
+						except SyntaxError as syntax_error:
+							# Of all the errors it throws, it throws this one? Well, okay fine whatever
 							raise IconError(
-								f'.ico file {icon_path} has some annoying error: {ex}'
-							) from ex
-						else:
-							return image
-					return icon_path
-
-				if not is_zip:
-					return icon_path
-
-				with zipfile.ZipFile(icon_path, 'r') as zip_file:
-					# TODO: Should just make this a comprehension I think, and for that matter could just be a generator since we are only passing it to max
-					icon_files: set[zipfile.ZipInfo] = set()
-					for zip_info in zip_file.infolist():
-						if zip_info.is_dir():
-							continue
-						if zip_info.filename.startswith('__MACOSX'):
-							# Yeah that happens with retail Linux games apparently
-							continue
-						if zip_info.filename.lower().endswith(('.ico', '.png')):
-							icon_files.add(zip_info)
-
-					# Get the biggest image file and assume that's the best icon we can have
-					# extracted_icon_file = sorted(icon_files, key=lambda zip_info: zip_info.file_size, reverse=True)[0]
-					extracted_icon_file = max(icon_files, key=attrgetter('file_size'))
-					extracted_icon_folder = main_config.image_folder.joinpath(
-						'Icon', 'extracted_from_zip', icon_hash
-					)
-					return Path(zip_file.extract(extracted_icon_file, path=extracted_icon_folder))
+								f'.ico file {icon_path} is not actually an .ico file at all'
+							) from syntax_error
+					except Exception as ex:
+						# Guess it's still broken
+						raise IconError(
+							f'.ico file {icon_path} has some annoying error: {ex}'
+						) from ex
+					else:
+						return image
+				return icon_path
+
+			if not is_zip:
+				return icon_path
+
+			with zipfile.ZipFile(icon_path, 'r') as zip_file:
+				# TODO: Should just make this a comprehension I think, and for that matter could just be a generator since we are only passing it to max
+				icon_files: set[zipfile.ZipInfo] = set()
+				for zip_info in zip_file.infolist():
+					if zip_info.is_dir():
+						continue
+					if zip_info.filename.startswith('__MACOSX'):
+						# Yeah that happens with retail Linux games apparently
+						continue
+					if zip_info.filename.lower().endswith(('.ico', '.png')):
+						icon_files.add(zip_info)
+
+				# Get the biggest image file and assume that's the best icon we can have
+				# extracted_icon_file = sorted(icon_files, key=lambda zip_info: zip_info.file_size, reverse=True)[0]
+				extracted_icon_file = max(icon_files, key=attrgetter('file_size'))
+				extracted_icon_folder = main_config.image_folder.joinpath(
+					'Icon', 'extracted_from_zip', icon_hash
+				)
+				return Path(zip_file.extract(extracted_icon_file, path=extracted_icon_folder))
 
 		raise IconNotFoundError(f'{icon_hash} not found')
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 
 import subprocess
-from importlib.util import find_spec
 
 from meowlauncher.game_sources.steam import have_steamfiles
 from meowlauncher.games.common.pc_common_info import have_pefile
@@ -19,8 +18,6 @@ except ImportError:
 else:
 	have_pillow = True
 
-have_pycdlib = find_spec('pycdlib') is not None
-
 # TODO: Check for itch.io butler, once we refactor all that
 
 
@@ -31,7 +28,6 @@ def main() -> None:
 		print('Pillow installed, version', pillow_version)
 	else:
 		print('Pillow not installed or importable')
-	print('pycdlib:', have_pycdlib)
 	print('steamfiles:', have_steamfiles)
 	print('machfs:', have_machfs)
 	print('macresources:', have_macresources)
@@ -325,3 +325,6 @@ class MainConfig(Settings):
 	dosbox_path: Path = Path('dosbox')
 	"""If using system DOSBox, executable name/path or just "dosbox" if left blank"""
 	# TODO: Should also be a global Runner
+
+	engine_detect_max_depth: int | None = 4
+	"""How many levels of subfolders to look through when trying to detect what engine a PC game uses (0 = just the game's folder), or blank for no limit"""
@@ -0,0 +1,198 @@
+"""Just enough of ISO 9660 to get a few small files and their dates out of a disc image, without parsing the whole volume structure up front like pycdlib does (which takes a while on a DVD image)
+Only reads the primary volume descriptor, so no Joliet/Rock Ridge names, but PlayStation discs and such don't use those anyway"""
+import mmap
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from types import TracebackType
+
+_sector_size = 2048
+_system_area_sectors = 16
+_directory_record_min_length = 33
+
+
+class ISO9660Error(Exception):
+	"""Image is not ISO 9660, or is broken in some way"""
+
+
+@dataclass(frozen=True)
+class DirectoryRecord:
+	name: str
+	"""Without the ;1 version suffix"""
+	extent: int
+	"""Logical block where the file's data starts"""
+	size: int
+	is_directory: bool
+	year: int
+	month: int
+	day: int
+
+
+def _normalize_name(name: str) -> str:
+	"""ISO 9660 names are uppercase and files have a ;1 (or some other version) on the end, so we ignore that and case, and the trailing dot on files without an extension"""
+	return name.partition(';')[0].rstrip('.').upper()
+
+
+class ISO9660Image:
+	"""Read-only view of an ISO 9660 image file, which is memory-mapped so only the parts we look at get read
+	Directories are only read the first time something inside them is looked up"""
+
+	def __init__(self, path: Path) -> None:
+		""":raises ISO9660Error: If there is no primary volume descriptor"""
+		self.path = path
+		with path.open('rb') as f:
+			try:
+				self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+			except ValueError as ex:
+				# Empty file
+				raise ISO9660Error(f'{path} is empty') from ex
+		try:
+			self._read_primary_volume_descriptor()
+		except ISO9660Error:
+			self.close()
+			raise
+		self._directories: dict[int, dict[str, DirectoryRecord]] = {}
+
+	def __enter__(self) -> 'ISO9660Image':
+		return self
+
+	def __exit__(
+		self,
+		exc_type: type[BaseException] | None,
+		exc_val: BaseException | None,
+		exc_tb: TracebackType | None,
+	) -> None:
+		self.close()
+
+	def close(self) -> None:
+		self._mmap.close()
+
+	def _read_primary_volume_descriptor(self) -> None:
+		sector = _system_area_sectors
+		while True:
+			offset = sector * _sector_size
+			descriptor = self._mmap[offset : offset + _sector_size]
+			if len(descriptor) < _sector_size or descriptor[1:6] != b'CD001':
+				raise ISO9660Error(f'{self.path} has no primary volume descriptor')
+			descriptor_type = descriptor[0]
+			if descriptor_type == 1:
+				break
+			if descriptor_type == 255:
+				# Volume descriptor set terminator
+				raise ISO9660Error(f'{self.path} has no primary volume descriptor')
+			sector += 1
+
+		# Numbers in here are stored as both little and big endian, we just use the little endian one
+		self.block_size = int.from_bytes(descriptor[128:130], 'little')
+		if not self.block_size:
+			raise ISO9660Error(f'{self.path} has a block size of 0')
+		self._path_table_size = int.from_bytes(descriptor[132:136], 'little')
+		self._path_table_location = int.from_bytes(descriptor[140:144], 'little')
+		self._root = self._parse_directory_record(descriptor[156:190])
+
+	def _read(self, offset: int, length: int) -> bytes:
+		""":raises ISO9660Error: If that goes past the end of the image, which would happen if it's truncated or something is corrupt"""
+		if offset < 0 or length < 0 or offset + length > len(self._mmap):
+			raise ISO9660Error(f'Tried to read {length} bytes at {offset} past the end of {self.path}')
+		return self._mmap[offset : offset + length]
+
+	@staticmethod
+	def _parse_directory_record(record: bytes) -> DirectoryRecord:
+		if len(record) < _directory_record_min_length:
+			raise ISO9660Error(f'Directory record is too short ({len(record)} bytes)')
+		name_length = record[32]
+		raw_name = record[33 : 33 + name_length]
+		if raw_name == b'\0':
+			name = '.'
+		elif raw_name == b'\1':
+			name = '..'
+		else:
+			name = _normalize_name(raw_name.decode('ascii', 'backslashreplace'))
+		return DirectoryRecord(
+			name,
+			int.from_bytes(record[2:6], 'little'),
+			int.from_bytes(record[10:14], 'little'),
+			bool(record[25] & 2),
+			record[18] + 1900,
+			record[19],
+			record[20],
+		)
+
+	@cached_property
+	def _directory_extents(self) -> dict[str, int]:
+		"""{uppercase path of directory without leading slash: logical block}, from the little endian path table, so we don't have to go through each directory above one to find it"""
+		extents: list[tuple[str, int]] = []
+		offset = self._path_table_location * self.block_size
+		path_table = self._read(offset, self._path_table_size)
+		offset = 0
+		while offset + 8 <= len(path_table):
+			name_length = path_table[offset]
+			if not name_length:
+				break
+			extent = int.from_bytes(path_table[offset + 2 : offset + 6], 'little')
+			parent_number = int.from_bytes(path_table[offset + 6 : offset + 8], 'little')
+			name = path_table[offset + 8 : offset + 8 + name_length]
+			if len(name) < name_length:
+				raise ISO9660Error(f'Path table in {self.path} is cut off')
+			if not extents:
+				# Root directory, has a name of \0
+				extents.append(('', extent))
+			else:
+				parent_path = extents[parent_number - 1][0] if 0 < parent_number <= len(extents) else ''
+				dir_name = _normalize_name(name.decode('ascii', 'backslashreplace'))
+				extents.append((f'{parent_path}/{dir_name}' if parent_path else dir_name, extent))
+			offset += 8 + name_length + (name_length % 2)
+		return dict(extents)
+
+	def _list_directory(self, extent: int) -> dict[str, DirectoryRecord]:
+		"""{normalized name: record} for everything in the directory starting at extent"""
+		directory = self._directories.get(extent)
+		if directory is not None:
+			return directory
+
+		directory = {}
+		start = extent * self.block_size
+		# The first record is the directory itself, which tells us how big the directory is
+		self_record_length = self._read(start, 1)[0]
+		if not self_record_length:
+			raise ISO9660Error(f'Directory at block {extent} in {self.path} is invalid')
+		size = self._parse_directory_record(self._read(start, self_record_length)).size
+		data = self._read(start, size)
+		offset = 0
+		while offset < size:
+			record_length = data[offset]
+			if not record_length:
+				# Records don't cross block boundaries, so the rest of this one is padding
+				offset = (offset // self.block_size + 1) * self.block_size
+				continue
+			if offset + record_length > size:
+				raise ISO9660Error(f'Directory at block {extent} in {self.path} is cut off')
+			record = self._parse_directory_record(data[offset : offset + record_length])
+			if record.name not in {'.', '..'}:
+				directory.setdefault(record.name, record)
+			offset += record_length
+		self._directories[extent] = directory
+		return directory
+
+	def get_record(self, iso_path: str) -> DirectoryRecord:
+		""":param iso_path: Path inside the ISO, e.g. /PSP_GAME/PARAM.SFO, case and ;1 suffix optional
+		:raises FileNotFoundError: If there is nothing at that path"""
+		parent, _, name = iso_path.strip('/').rpartition('/')
+		if not name:
+			return self._root
+		parent_extent = self._directory_extents.get(_normalize_name(parent))
+		if parent_extent is None:
+			raise FileNotFoundError(f'{iso_path} not found in {self.path}')
+		record = self._list_directory(parent_extent).get(_normalize_name(name))
+		if record is None:
+			raise FileNotFoundError(f'{iso_path} not found in {self.path}')
+		return record
+
+	def read_file(self, iso_path: str) -> bytes:
+		""":raises FileNotFoundError: If there is no file at that path
+		:raises IsADirectoryError: If iso_path is a directory
+		:raises ISO9660Error: If the file goes past the end of the image"""
+		record = self.get_record(iso_path)
+		if record.is_directory:
+			raise IsADirectoryError(f'{iso_path} in {self.path} is a directory')
+		return self._read(record.extent * self.block_size, record.size)
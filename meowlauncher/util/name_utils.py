@@ -4,7 +4,7 @@ from collections.abc import Collection
 from meowlauncher import config
 from meowlauncher.data.name_cleanup.capitalized_words_in_names import capitalized_words
 
-from .utils import convert_roman_numeral, is_roman_numeral, title_word
+from .utils import convert_roman_numeral, is_roman_numeral, remove_filename_tags, title_word
 
 chapter_matcher = re.compile(r'\b(?:Chapter|Vol|Volume|Episode|Part|Version)\b(?:\.)?', flags=re.RegexFlag.IGNORECASE)
 
@@ -112,6 +112,10 @@ def normalize_name(name: str, care_about_spaces: bool=True, normalize_words: boo
 		return (' ' if care_about_spaces else '').join(match[0] for match in _words_regex.finditer(name))
 	return name
 
+def get_name_match_key(name: str) -> str:
+	"""Normalized name without tags, so names that would be considered to match when fuzzily comparing them end up with the same key, and it can be used to index candidates for such a comparison"""
+	return normalize_name(remove_filename_tags(name))
+
 dont_capitalize_these = {'the', 'a', 'an', 'and', 'or', 'at', 'with', 'to', 'of', 'is'}
 def _title_case_sentence_part(s: str, words_to_ignore_case: Collection[str] | None=None) -> str:
 	words = re.split(' ', s)
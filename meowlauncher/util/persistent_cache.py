@@ -0,0 +1,120 @@
+"""Keeping stuff in cache_dir between runs, so we don't have to reparse some big database or file every single time
+Everything here is pickled, so don't go putting anything in here that isn't ours, and if something goes wrong when loading it, we just pretend the cache wasn't there"""
+import atexit
+import logging
+import pickle
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+from meowlauncher.common_paths import cache_dir
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+FileFingerprint = tuple[str, int, int]
+"""(path, size, mtime in nanoseconds), something that should change if the file changes"""
+
+
+def get_file_fingerprint(path: Path) -> FileFingerprint | None:
+	"""Returns the fingerprint of a file for use as (part of) a cache key, or None if it doesn't exist or can't be statted"""
+	try:
+		stat = path.stat()
+	except OSError:
+		return None
+	return str(path), stat.st_size, stat.st_mtime_ns
+
+
+def _get_cache_path(name: str) -> Path:
+	return cache_dir / f'{name}.pickle'
+
+
+def load_from_cache(name: str, key: Hashable) -> Any | None:
+	"""Returns what was stored with save_to_cache under this name, if it was stored with the same key, or None if it wasn't or there is nothing stored"""
+	try:
+		with _get_cache_path(name).open('rb') as f:
+			cached_key, value = pickle.load(f)
+	except FileNotFoundError:
+		return None
+	except Exception:  # noqa: BLE001 #pickle can throw all sorts of things if the file is corrupt or from an older version of a class, and we don't care which
+		logger.debug('Could not load %s from cache, ignoring', name, exc_info=True)
+		return None
+	if cached_key != key:
+		return None
+	return value
+
+
+def save_to_cache(name: str, key: Hashable, value: object) -> None:
+	"""Stores value in the cache directory, overwriting anything that was there before with that name. Writes to a temporary file first so we don't leave a half-written cache if interrupted"""
+	path = _get_cache_path(name)
+	try:
+		path.parent.mkdir(parents=True, exist_ok=True)
+		temp_path = path.with_suffix('.tmp')
+		with temp_path.open('wb') as f:
+			pickle.dump((key, value), f, pickle.HIGHEST_PROTOCOL)
+		temp_path.replace(path)
+	except OSError:
+		logger.exception('Could not save %s to cache', name)
+
+
+def load_or_create_cached(name: str, key: Hashable, create: Callable[[], T]) -> T:
+	"""Loads name from the cache if it is there with the same key, or calls create and stores the result if not
+	:param key: Something picklable and comparable that changes whenever the result of create would, e.g. a file fingerprint of the file it is parsed from"""
+	value = load_from_cache(name, key)
+	if value is None:
+		value = create()
+		save_to_cache(name, key, value)
+	return value
+
+
+class PersistentLRUCache(Generic[K, V]):
+	"""Mapping that is kept in the cache directory between runs, but only keeps the maxsize most recently used items so it doesn't just grow forever
+	It is loaded the first time it is used, and saved when the program exits if anything was added"""
+
+	def __init__(self, name: str, maxsize: int, version: Hashable = None) -> None:
+		""":param version: If this is not the same as what the saved cache was saved with, the saved cache is ignored, so change it if the values would now be different"""
+		self.name = name
+		self.maxsize = maxsize
+		self.version = version
+		self._items: OrderedDict[K, V] | None = None
+		self._changed = False
+		self._lock = threading.Lock()
+
+	def _get_items(self) -> 'OrderedDict[K, V]':
+		if self._items is None:
+			loaded = load_from_cache(self.name, self.version)
+			self._items = loaded if isinstance(loaded, OrderedDict) else OrderedDict()
+			atexit.register(self.save)
+		return self._items
+
+	def get(self, key: K) -> V | None:
+		with self._lock:
+			items = self._get_items()
+			value = items.get(key)
+			if value is not None:
+				items.move_to_end(key)
+			return value
+
+	def __setitem__(self, key: K, value: V) -> None:
+		with self._lock:
+			items = self._get_items()
+			items[key] = value
+			items.move_to_end(key)
+			while len(items) > self.maxsize:
+				items.popitem(last=False)
+			self._changed = True
+
+	def __len__(self) -> int:
+		return len(self._get_items())
+
+	def save(self) -> None:
+		with self._lock:
+			if self._items is None or not self._changed:
+				return
+			save_to_cache(self.name, self.version, self._items)
+			self._changed = False